@@ -3,11 +3,45 @@ AI Summary Module
 Generates financial insights using AI or rule-based fallback
 """
 
+import hashlib
+import json
 import os
-from typing import Dict, Optional, Tuple
+import random
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
 import pandas as pd
 
 
+# Claude response cache (exact-match on the canonical request signature).
+# Streamlit reruns the script on every interaction, so re-analyzing the same
+# financial data would otherwise issue an identical API call each time.
+AI_CACHE_MAX_ENTRIES = 64
+AI_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+_AI_RESPONSE_CACHE: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+# Streamlit runs each session's script in its own thread; guards the cache above.
+_AI_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# Client-side rate limits (Anthropic Tier 1 defaults) and 429 retry policy.
+AI_RATE_LIMIT_RPM = 50
+AI_RATE_LIMIT_TPM = 80_000
+AI_RATE_LIMIT_MAX_RETRIES = 3
+AI_RATE_LIMIT_MAX_BACKOFF_SECONDS = 30.0
+
+
+_OPEX_KEYS = ('distribution_expenses', 'marketing_admin', 'research_dev', 'depreciation_expense')
+_EXPENSE_KEYS = _OPEX_KEYS + ('interest_expense', 'tax_expense')
+
+
+def _net_income(data: Dict) -> float:
+    """Net income for one year: revenue less COGS and all expense lines"""
+    return data.get('revenue', 0) - data.get('cogs', 0) - sum(data.get(k, 0) for k in _EXPENSE_KEYS)
+
+
 def generate_rule_based_summary(financial_data: Dict[int, Dict],
                                 has_balance_sheet: bool = True,
                                 has_cash_flow: bool = True) -> str:
@@ -67,16 +101,8 @@ def generate_rule_based_summary(financial_data: Dict[int, Dict],
         rev_latest = financial_data[latest_year].get('revenue', 0)
         rev_growth = ((rev_latest / rev_first - 1) * 100) if rev_first > 0 else 0
         
-        ni_first = (financial_data[first_year].get('revenue', 0) - 
-                   financial_data[first_year].get('cogs', 0) - 
-                   sum([financial_data[first_year].get(k, 0) for k in 
-                       ['distribution_expenses', 'marketing_admin', 'research_dev', 
-                        'depreciation_expense', 'interest_expense', 'tax_expense']]))
-        ni_latest = (financial_data[latest_year].get('revenue', 0) - 
-                    financial_data[latest_year].get('cogs', 0) - 
-                    sum([financial_data[latest_year].get(k, 0) for k in 
-                        ['distribution_expenses', 'marketing_admin', 'research_dev', 
-                         'depreciation_expense', 'interest_expense', 'tax_expense']]))
+        ni_first = _net_income(financial_data[first_year])
+        ni_latest = _net_income(financial_data[latest_year])
         ni_growth = ((ni_latest / ni_first - 1) * 100) if ni_first > 0 else 0
         
         summary_parts.append(f"\n\n📊 TREND ANALYSIS ({first_year} to {latest_year})")
@@ -127,10 +153,7 @@ def generate_rule_based_summary(financial_data: Dict[int, Dict],
         latest = financial_data[latest_year]
         
         cfo = sum([
-            latest.get('revenue', 0) - latest.get('cogs', 0) - 
-            sum([latest.get(k, 0) for k in ['distribution_expenses', 'marketing_admin', 
-                                            'research_dev', 'depreciation_expense', 
-                                            'interest_expense', 'tax_expense']]),
+            _net_income(latest),
             latest.get('depreciation_expense', 0),
             latest.get('delta_ar', 0),
             latest.get('delta_inventory', 0),
@@ -156,18 +179,9 @@ def generate_rule_based_summary(financial_data: Dict[int, Dict],
     # Recommendations
     summary_parts.append("\n\n💡 KEY OBSERVATIONS")
     
+    # (net_margin and the leverage totals were computed for the latest year above)
     if len(years) >= 1:
-        latest_year = years[-1]
-        latest = financial_data[latest_year]
-        
         # Profitability
-        revenue = latest.get('revenue', 0)
-        net_income = (revenue - latest.get('cogs', 0) - 
-                     sum([latest.get(k, 0) for k in ['distribution_expenses', 'marketing_admin', 
-                                                     'research_dev', 'depreciation_expense', 
-                                                     'interest_expense', 'tax_expense']]))
-        net_margin = (net_income / revenue * 100) if revenue > 0 else 0
-        
         if net_margin > 15:
             summary_parts.append("✓ Strong profitability with healthy margins")
         elif net_margin > 5:
@@ -177,13 +191,6 @@ def generate_rule_based_summary(financial_data: Dict[int, Dict],
         
         # Leverage
         if has_balance_sheet:
-            total_liab = sum([latest.get(k, 0) for k in 
-                            ['accounts_payable', 'accrued_payroll', 'deferred_revenue', 
-                             'interest_payable', 'other_current_liabilities', 
-                             'income_taxes_payable', 'long_term_debt']])
-            total_equity = sum([latest.get(k, 0) for k in ['common_stock', 'retained_earnings']])
-            debt_to_equity = (total_liab / total_equity) if total_equity > 0 else 0
-            
             if debt_to_equity < 1:
                 summary_parts.append("✓ Conservative leverage position")
             elif debt_to_equity < 2:
@@ -203,10 +210,253 @@ def generate_rule_based_summary(financial_data: Dict[int, Dict],
     return "\n".join(summary_parts)
 
 
+def _request_signature(model: str, max_tokens: int, messages: list,
+                       system: Optional[list] = None, api_key: Optional[str] = None) -> str:
+    """
+    Compute a SHA-256 signature for a Claude request.
+
+    Inputs are canonicalized (lowercased model, sorted JSON keys, NFC-normalized text)
+    so that semantically identical requests map to the same key. A hash of the API key
+    scopes the signature, so one key's cached response is never served to another.
+    """
+    payload = {
+        'api_key': hashlib.sha256(api_key.encode('utf-8')).hexdigest() if api_key else None,
+        'model': model.strip().lower(),
+        'max_tokens': int(max_tokens),
+        'system': system,
+        'messages': messages,
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    canonical = unicodedata.normalize('NFC', canonical)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class _RateLimiter:
+    """
+    Sliding-window limiter for Claude calls (requests and tokens per minute).
+
+    The request budget adapts AIMD-style: it is halved whenever the API answers
+    429 and grows back by one request per successful call, up to `rpm`.
+    """
+
+    def __init__(self, rpm: int, tpm: int, window: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.max_rpm = rpm
+        self.rpm = float(rpm)
+        self.tpm = tpm
+        self.window = window
+        self.clock = clock
+        self.sleep = sleep
+        self._calls: "deque[Tuple[float, int]]" = deque()  # (timestamp, estimated tokens)
+        self._lock = threading.Lock()
+
+    def _wait_time(self, now: float, tokens: int) -> float:
+        while self._calls and now - self._calls[0][0] >= self.window:
+            self._calls.popleft()
+        if not self._calls:
+            return 0.0
+        used_tokens = sum(t for _, t in self._calls)
+        if len(self._calls) < int(self.rpm) and used_tokens + tokens <= self.tpm:
+            return 0.0
+        return self._calls[0][0] + self.window - now
+
+    def acquire(self, tokens: int) -> None:
+        """Block until a call estimated at `tokens` fits in the window, then record it"""
+        while True:
+            with self._lock:
+                now = self.clock()
+                wait = self._wait_time(now, tokens)
+                if wait <= 0:
+                    self._calls.append((now, tokens))
+                    return
+            self.sleep(wait)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rpm = min(float(self.max_rpm), self.rpm + 1)
+
+    def on_rate_limited(self) -> None:
+        with self._lock:
+            self.rpm = max(1.0, self.rpm / 2)
+
+
+_RATE_LIMITER = _RateLimiter(AI_RATE_LIMIT_RPM, AI_RATE_LIMIT_TPM)
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Transient API failures worth retrying: connection errors, 408, 409, 429 and 5xx (incl. 529 overloaded)"""
+    status = getattr(exc, 'status_code', None)
+    if status is not None:
+        return status in (408, 409, 429) or status >= 500
+    try:
+        from anthropic import APIConnectionError
+    except ImportError:
+        return False
+    return isinstance(exc, APIConnectionError)
+
+
+def _call_claude(client, request: dict,
+                 on_text: Optional[Callable[[str], None]] = None) -> str:
+    """
+    Send one request through the rate limiter, retrying transient failures with jittered backoff.
+
+    Only 429s slow the rate limiter down; other retryable errors just back off.
+    """
+    # Rough token estimate: ~4 characters per input token plus the output budget
+    tokens_est = int(request['max_tokens']) + len(json.dumps(request, ensure_ascii=False)) // 4
+
+    for attempt in range(AI_RATE_LIMIT_MAX_RETRIES + 1):
+        _RATE_LIMITER.acquire(tokens_est)
+        try:
+            if on_text is None:
+                message = client.messages.create(**request)
+                text = message.content[0].text
+            else:
+                text = ""
+                with client.messages.stream(**request) as stream:
+                    for chunk in stream.text_stream:
+                        text += chunk
+                        on_text(text)
+        except Exception as e:
+            if not _is_retryable(e) or attempt == AI_RATE_LIMIT_MAX_RETRIES:
+                raise
+            if getattr(e, 'status_code', None) == 429:
+                _RATE_LIMITER.on_rate_limited()
+            backoff = min(AI_RATE_LIMIT_MAX_BACKOFF_SECONDS, 2.0 ** attempt)
+            _RATE_LIMITER.sleep(backoff * random.uniform(0.5, 1.0))
+            continue
+        _RATE_LIMITER.on_success()
+        return text
+
+
+def _cached_completion(client, model: str, max_tokens: int, messages: list,
+                       on_text: Optional[Callable[[str], None]] = None,
+                       system: Optional[list] = None) -> str:
+    """
+    Return the response text for a Claude request, serving repeats from the cache.
+
+    Entries are scoped to the client's API key, expire after AI_CACHE_TTL_SECONDS,
+    and the least recently used entry is evicted once AI_CACHE_MAX_ENTRIES is exceeded.
+
+    If on_text is given, the response is streamed and on_text is called with the
+    text received so far after every chunk (once with the full text on a cache hit).
+    """
+    key = _request_signature(model, max_tokens, messages, system,
+                             api_key=getattr(client, 'api_key', None))
+    now = time.time()
+
+    with _AI_RESPONSE_CACHE_LOCK:
+        cached = _AI_RESPONSE_CACHE.get(key)
+        if cached is not None:
+            if now - cached[0] <= AI_CACHE_TTL_SECONDS:
+                _AI_RESPONSE_CACHE.move_to_end(key)
+            else:
+                del _AI_RESPONSE_CACHE[key]
+                cached = None
+
+    if cached is not None:
+        text = cached[1]
+        if on_text is not None:
+            on_text(text)
+        return text
+
+    request = {'model': model, 'max_tokens': max_tokens, 'messages': messages}
+    if system is not None:
+        request['system'] = system
+
+    # The API call runs outside the lock so one slow request never blocks other sessions.
+    text = _call_claude(client, request, on_text)
+
+    with _AI_RESPONSE_CACHE_LOCK:
+        _AI_RESPONSE_CACHE[key] = (now, text)
+        _AI_RESPONSE_CACHE.move_to_end(key)
+        while len(_AI_RESPONSE_CACHE) > AI_CACHE_MAX_ENTRIES:
+            _AI_RESPONSE_CACHE.popitem(last=False)
+
+    return text
+
+
+@lru_cache(maxsize=4)
+def _get_client(api_key: str):
+    """
+    Return a shared Anthropic client per API key.
+
+    The module outlives Streamlit reruns, so reusing the client keeps its HTTP
+    connection pool (and TLS sessions) warm across clicks.
+
+    SDK retries are disabled: _call_claude owns the retry policy (connection errors,
+    408/409/429/5xx), so every 429 reaches the rate limiter instead of being retried
+    (and multiplied) inside the SDK first.
+    """
+    from anthropic import Anthropic
+
+    return Anthropic(api_key=api_key, max_retries=0)
+
+
+def clear_ai_cache() -> None:
+    """Drop all cached Claude responses"""
+    with _AI_RESPONSE_CACHE_LOCK:
+        _AI_RESPONSE_CACHE.clear()
+
+
+# Static prompt scaffold, built once at import. Only the user message (the
+# financial data context) changes between requests.
+_ANALYST_INSTRUCTIONS = """You are a financial analyst. Analyze the financial data provided by the user and provide:
+
+1. Executive Summary (2-3 sentences)
+2. Key Trends (revenue, profitability)
+3. Financial Health Assessment
+4. Recommendations (2-3 actionable items)
+
+IMPORTANT: Only analyze statements that are marked as "Available". Do NOT make assumptions about missing data.
+
+Provide concise, professional analysis suitable for a management report."""
+
+_ANALYST_SYSTEM = [{
+    "type": "text",
+    "text": _ANALYST_INSTRUCTIONS,
+}]
+
+_ASSET_KEYS = ('cash', 'accounts_receivable', 'inventory', 'prepaid_expenses', 'other_current_assets', 'ppe_gross')
+
+
+def _build_summary_context(financial_data: Dict[int, Dict],
+                           has_balance_sheet: bool,
+                           has_cash_flow: bool) -> str:
+    """Render the financial data block sent to Claude as the user message"""
+    lines = ["Financial Data:", ""]
+
+    for year in sorted(financial_data.keys()):
+        data = financial_data[year]
+        revenue = data.get('revenue', 0)
+        cogs = data.get('cogs', 0)
+        lines.append(f"{year}:")
+        lines.append(f"  Revenue: ${revenue:,.0f}")
+        lines.append(f"  COGS: ${cogs:,.0f}")
+        lines.append(f"  Operating Expenses: ${sum(data.get(k, 0) for k in _OPEX_KEYS):,.0f}")
+        lines.append(f"  Net Income: ${_net_income(data):,.0f}")
+
+        if has_balance_sheet:
+            lines.append(f"  Total Assets: ${sum(data.get(k, 0) for k in _ASSET_KEYS) - data.get('accumulated_depreciation', 0):,.0f}")
+            lines.append(f"  Total Debt: ${data.get('long_term_debt', 0):,.0f}")
+
+        lines.append("")
+
+    # Data availability notes
+    lines.append("")
+    lines.append("Data Availability:")
+    lines.append(f"- Balance Sheet: {'Available' if has_balance_sheet else 'NOT AVAILABLE (TB missing)'}")
+    lines.append(f"- Cash Flow: {'Available' if has_cash_flow else 'INCOMPLETE (single year or TB missing)'}")
+
+    return "\n".join(lines) + "\n"
+
+
 def generate_ai_summary(financial_data: Dict[int, Dict],
                        has_balance_sheet: bool = True,
                        has_cash_flow: bool = True,
-                       api_key: Optional[str] = None) -> Tuple[str, bool]:
+                       api_key: Optional[str] = None,
+                       on_text: Optional[Callable[[str], None]] = None) -> Tuple[str, bool]:
     """
     Generate AI-powered summary using Anthropic Claude
     
@@ -215,6 +465,7 @@ def generate_ai_summary(financial_data: Dict[int, Dict],
         has_balance_sheet: Whether balance sheet is available
         has_cash_flow: Whether cash flow is available
         api_key: Anthropic API key
+        on_text: Optional callback receiving the partial summary while it streams
     
     Returns:
         (summary_text, used_ai_flag)
@@ -228,58 +479,25 @@ def generate_ai_summary(financial_data: Dict[int, Dict],
         return generate_rule_based_summary(financial_data, has_balance_sheet, has_cash_flow), False
     
     try:
-        from anthropic import Anthropic
-        
-        client = Anthropic(api_key=api_key)
-        
-        # Prepare financial data summary
-        years = sorted(financial_data.keys())
-        
-        # Build context
-        context = "Financial Data:\n\n"
+        client = _get_client(api_key)
         
-        for year in years:
-            data = financial_data[year]
-            context += f"{year}:\n"
-            context += f"  Revenue: ${data.get('revenue', 0):,.0f}\n"
-            context += f"  COGS: ${data.get('cogs', 0):,.0f}\n"
-            context += f"  Operating Expenses: ${sum([data.get(k, 0) for k in ['distribution_expenses', 'marketing_admin', 'research_dev', 'depreciation_expense']]):,.0f}\n"
-            context += f"  Net Income: ${data.get('revenue', 0) - data.get('cogs', 0) - sum([data.get(k, 0) for k in ['distribution_expenses', 'marketing_admin', 'research_dev', 'depreciation_expense', 'interest_expense', 'tax_expense']]):,.0f}\n"
-            
-            if has_balance_sheet:
-                context += f"  Total Assets: ${sum([data.get(k, 0) for k in ['cash', 'accounts_receivable', 'inventory', 'prepaid_expenses', 'other_current_assets', 'ppe_gross']]) - data.get('accumulated_depreciation', 0):,.0f}\n"
-                context += f"  Total Debt: ${data.get('long_term_debt', 0):,.0f}\n"
-            
-            context += "\n"
+        context = _build_summary_context(financial_data, has_balance_sheet, has_cash_flow)
         
-        # Add data availability notes
-        context += f"\nData Availability:\n"
-        context += f"- Balance Sheet: {'Available' if has_balance_sheet else 'NOT AVAILABLE (TB missing)'}\n"
-        context += f"- Cash Flow: {'Available' if has_cash_flow else 'INCOMPLETE (single year or TB missing)'}\n"
-        
-        # Call Claude
-        message = client.messages.create(
+        # Call Claude (identical requests are served from the response cache).
+        # The instructions live in a constant system block; only the financial
+        # data in the user message varies.
+        ai_summary = _cached_completion(
+            client,
             model="claude-sonnet-4-20250514",
             max_tokens=1000,
+            on_text=on_text,
+            system=_ANALYST_SYSTEM,
             messages=[{
                 "role": "user",
-                "content": f"""You are a financial analyst. Analyze this financial data and provide:
-
-1. Executive Summary (2-3 sentences)
-2. Key Trends (revenue, profitability)
-3. Financial Health Assessment
-4. Recommendations (2-3 actionable items)
-
-IMPORTANT: Only analyze statements that are marked as "Available". Do NOT make assumptions about missing data.
-
-{context}
-
-Provide concise, professional analysis suitable for a management report."""
+                "content": context,
             }]
         )
         
-        ai_summary = message.content[0].text
-        
         # Add disclaimer about data limitations
         if not has_balance_sheet or not has_cash_flow:
             disclaimer = "\n\n⚠️ NOTE: "
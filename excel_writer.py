@@ -7,12 +7,19 @@ Never relies on hardcoded row numbers
 import openpyxl
 from openpyxl.utils import get_column_letter
 from openpyxl.styles import numbers
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
 import io
 from mapping import TEMPLATE_LABEL_MAPPING
 
 
+# Internal data key -> template label (first label wins when several map to one key)
+_KEY_TO_TEMPLATE_LABEL: Dict[str, str] = {
+    key: label for label, key in reversed(list(TEMPLATE_LABEL_MAPPING.items()))
+}
+
+
 def find_row_by_label(ws, label: str, search_column: int = 1, 
                       start_row: int = 1, end_row: int = 200) -> Optional[int]:
     """
@@ -139,6 +146,16 @@ def write_financial_data_to_template(template_path: str,
     # Track what was written
     writes_performed = []
     warnings = []
+
+    # Label rows don't move while we write values: read column A once (same range and
+    # matching rule as find_row_by_label) and resolve each label against that list once
+    column_a = [
+        (row, str(value).lower().strip())
+        for row, (value,) in enumerate(
+            ws.iter_rows(min_row=1, max_row=200, min_col=1, max_col=1, values_only=True), start=1)
+        if value
+    ]
+    label_rows: Dict[str, Optional[int]] = {}
     
     # Write data using label lookup
     for year, data in financial_data.items():
@@ -150,17 +167,16 @@ def write_financial_data_to_template(template_path: str,
         
         for data_key, value in data.items():
             # Find template label for this data key
-            template_label = None
-            for label, key in TEMPLATE_LABEL_MAPPING.items():
-                if key == data_key:
-                    template_label = label
-                    break
+            template_label = _KEY_TO_TEMPLATE_LABEL.get(data_key)
             
             if not template_label:
                 continue
             
             # Find row by label
-            row = find_row_by_label(ws, template_label)
+            if template_label not in label_rows:
+                target = template_label.lower().strip()
+                label_rows[template_label] = next((r for r, text in column_a if target in text), None)
+            row = label_rows[template_label]
             
             if row is None:
                 warnings.append(f'Label "{template_label}" not found in template')
@@ -205,34 +221,65 @@ def calculate_financial_statements(df: pd.DataFrame,
     This function is kept for backward compatibility. For best results when you have
     BOTH TB (BS) and GL (IS), use calculate_3statements_from_tb_gl().
     """
-    df = df.copy()
-    df['TxnDate'] = pd.to_datetime(df['TxnDate'], errors='coerce')
-    df = df[df['TxnDate'].notna()].copy()
-    df['Year'] = df['TxnDate'].dt.year
+    # Parse dates (skipped when already datetime, e.g. frames returned by apply_auto_fixes)
+    # and drop undated rows without copying the caller's frame twice
+    txn_date = df['TxnDate']
+    if not pd.api.types.is_datetime64_any_dtype(txn_date):
+        txn_date = pd.to_datetime(txn_date, errors='coerce')
+    valid = txn_date.notna()
+    df = df.loc[valid].assign(TxnDate=txn_date[valid])
+    # Calendar year via the .dt accessor: it works in the column's own unit (and timezone),
+    # so dates outside the datetime64[ns] range (e.g. a 3023 typo) keep their real year
+    df['Year'] = df['TxnDate'].dt.year.astype('int64')
 
     financial_data: Dict[int, Dict] = {}
 
     years = sorted(df['Year'].dropna().unique())
 
-    for year in years:
-        year_data = df[df['Year'] == year].copy()
-
-        # TB: use the latest date in the year as the snapshot (avoids summing monthly snapshots)
-        if is_trial_balance:
-            latest_dt = year_data['TxnDate'].max()
-            year_data = year_data[year_data['TxnDate'] == latest_dt].copy()
-
+    # TB: use the latest date in each year as the snapshot (avoids summing monthly snapshots)
+    if is_trial_balance:
+        latest_dt = df.groupby('Year')['TxnDate'].transform('max')
+        df = df[df['TxnDate'] == latest_dt]
+
+    # One pass over all years: integer-code each row's (year, category) cell and
+    # accumulate Debit/Credit into a flat matrix with np.bincount (NaN amounts count as 0,
+    # unmapped rows are skipped, same as a groupby sum)
+    category_codes, categories = pd.factorize(df['FSLI_Category'])
+    year_codes = np.searchsorted(years, df['Year'].to_numpy())
+    mapped = category_codes >= 0
+    cells = year_codes[mapped] * len(categories) + category_codes[mapped]
+    shape = (len(years), len(categories))
+    size = shape[0] * shape[1]
+    debit = np.nan_to_num(df['Debit'].to_numpy(dtype=float, na_value=np.nan)[mapped])
+    credit = np.nan_to_num(df['Credit'].to_numpy(dtype=float, na_value=np.nan)[mapped])
+    debit_totals = np.bincount(cells, weights=debit, minlength=size).reshape(shape)
+    credit_totals = np.bincount(cells, weights=credit, minlength=size).reshape(shape)
+    present = np.bincount(cells, minlength=size).reshape(shape) > 0
+    # Net (debit - credit) and its magnitude for every cell in two whole-matrix ops;
+    # liability/equity/contra lines read the magnitude instead of calling abs() per item
+    net_totals = debit_totals - credit_totals
+    abs_net_totals = np.abs(net_totals)
+    category_index = {category: i for i, category in enumerate(categories)}
+
+    for year_idx, year in enumerate(years):
         def sum_category(category: str, debit_credit: str = 'both') -> float:
-            cat_data = year_data[year_data['FSLI_Category'] == category]
-            if cat_data.empty:
+            col = category_index.get(category)
+            if col is None or not present[year_idx, col]:
                 return 0.0
             if debit_credit == 'debit':
-                return float(cat_data['Debit'].sum())
+                return float(debit_totals[year_idx, col])
             elif debit_credit == 'credit':
-                return float(cat_data['Credit'].sum())
+                return float(credit_totals[year_idx, col])
             else:
                 # Net method (debit - credit)
-                return float(cat_data['Debit'].sum() - cat_data['Credit'].sum())
+                return float(net_totals[year_idx, col])
+
+        def abs_category(category: str) -> float:
+            """Magnitude of the net balance (liabilities/equity are credit-normal)"""
+            col = category_index.get(category)
+            if col is None or not present[year_idx, col]:
+                return 0.0
+            return float(abs_net_totals[year_idx, col])
 
         # Income Statement (GL expected; TB will be 0)
         revenue = sum_category('revenue', 'credit')
@@ -258,19 +305,19 @@ def calculate_financial_statements(df: pd.DataFrame,
         other_current_assets = sum_category('other_current_assets')
 
         ppe_gross = sum_category('ppe_gross')
-        accumulated_depreciation = abs(sum_category('accumulated_depreciation'))  # positive number
+        accumulated_depreciation = abs_category('accumulated_depreciation')  # positive number
         # Liabilities (ensure positive)
-        accounts_payable = abs(sum_category('accounts_payable'))
-        accrued_payroll = abs(sum_category('accrued_payroll'))
-        deferred_revenue = abs(sum_category('deferred_revenue'))
-        interest_payable = abs(sum_category('interest_payable'))
-        other_current_liabilities = abs(sum_category('other_current_liabilities'))
-        income_taxes_payable = abs(sum_category('income_taxes_payable'))
-        long_term_debt = abs(sum_category('long_term_debt'))
+        accounts_payable = abs_category('accounts_payable')
+        accrued_payroll = abs_category('accrued_payroll')
+        deferred_revenue = abs_category('deferred_revenue')
+        interest_payable = abs_category('interest_payable')
+        other_current_liabilities = abs_category('other_current_liabilities')
+        income_taxes_payable = abs_category('income_taxes_payable')
+        long_term_debt = abs_category('long_term_debt')
 
         # Equity
-        common_stock = abs(sum_category('common_stock'))
-        retained_earnings = abs(sum_category('retained_earnings'))
+        common_stock = abs_category('common_stock')
+        retained_earnings = abs_category('retained_earnings')
 
         financial_data[year] = {
             # Income Statement
@@ -372,8 +419,9 @@ def calculate_3statements_from_tb_gl(tb_df: pd.DataFrame,
     if not all_years:
         return {}
 
+    # all_years is already sorted, so the slice is too
     stmt_years = all_years[-int(statement_years):] if len(all_years) >= statement_years else all_years
-    stmt_years = sorted(stmt_years)
+    stmt_year_set = set(stmt_years)
 
     # Year0 requirement
     first_stmt_year = int(stmt_years[0])
@@ -399,7 +447,7 @@ def calculate_3statements_from_tb_gl(tb_df: pd.DataFrame,
         combined[y] = {}
         combined[y].update(tb_fin.get(y, {}))
         # Only statement years should pull GL activity
-        if y in stmt_years:
+        if y in stmt_year_set:
             # Only bring Income Statement keys from GL to avoid overwriting BS snapshot values
             gl_part = gl_fin.get(y, {})
             combined[y].update({k: gl_part.get(k, 0.0) for k in is_keys})
@@ -416,11 +464,7 @@ def calculate_3statements_from_tb_gl(tb_df: pd.DataFrame,
         for k in bs_keys:
             combined[y].setdefault(k, 0.0)
         # For statement years, ensure IS keys exist (Year0 IS inputs stay empty/0)
-        if y in stmt_years:
-            for k in is_keys:
-                combined[y].setdefault(k, 0.0)
-        # For statement years, ensure IS keys exist (Year0 IS inputs stay empty/0)
-        if y in stmt_years:
+        if y in stmt_year_set:
             for k in is_keys:
                 combined[y].setdefault(k, 0.0)
 
@@ -5,6 +5,7 @@ Handles mapping of GL accounts to financial statement line items using:
 2. Secondary: Account number range fallback
 """
 
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
 import re
@@ -49,6 +50,15 @@ DEFAULT_ACCOUNT_RANGES = {
 }
 
 
+# DEFAULT_ACCOUNT_RANGES as parallel arrays sorted by range start, built once at import.
+# The default ranges do not overlap, so an account can only fall in the range with the
+# largest start <= the number: one binary search replaces the ordered scan.
+_DEFAULT_RANGE_ITEMS = sorted(DEFAULT_ACCOUNT_RANGES.items(), key=lambda item: item[1][0])
+_DEFAULT_RANGE_STARTS = np.array([start for _, (start, _) in _DEFAULT_RANGE_ITEMS], dtype=float)
+_DEFAULT_RANGE_ENDS = np.array([end for _, (_, end) in _DEFAULT_RANGE_ITEMS], dtype=float)
+_DEFAULT_RANGE_CATEGORIES = np.array([category for category, _ in _DEFAULT_RANGE_ITEMS], dtype=object)
+
+
 # Name-based alias mapping (primary method)
 ACCOUNT_NAME_ALIASES = {
     # Assets
@@ -199,6 +209,27 @@ def normalize_account_name(name: str) -> str:
     return normalized
 
 
+def _compile_alias_patterns() -> List[Tuple[str, List[re.Pattern]]]:
+    """
+    Normalize, order (longest first) and compile every alias once, so name
+    matching doesn't re-sort and re-build the regexes for each account.
+    """
+    compiled = []
+    for fsli_category, aliases in ACCOUNT_NAME_ALIASES.items():
+        patterns = []
+        for alias in sorted(aliases, key=lambda x: len(x), reverse=True):
+            alias_norm = normalize_account_name(alias)
+            if not alias_norm:
+                continue
+            # Match full phrase with boundaries
+            patterns.append(re.compile(r'\b' + re.escape(alias_norm) + r'\b'))
+        compiled.append((fsli_category, patterns))
+    return compiled
+
+
+_ALIAS_PATTERNS = _compile_alias_patterns()
+
+
 def map_account_by_name(account_name: str) -> Optional[str]:
     """
     Map account to FSLI line item by safer name matching.
@@ -218,13 +249,9 @@ def map_account_by_name(account_name: str) -> Optional[str]:
         return classify_accrued_liability(account_name)
 
     # Check aliases (longest first) with word-boundary phrase matching
-    for fsli_category, aliases in ACCOUNT_NAME_ALIASES.items():
-        for alias in sorted(aliases, key=lambda x: len(x), reverse=True):
-            alias_norm = normalize_account_name(alias)
-            if not alias_norm:
-                continue
-            # Match full phrase with boundaries
-            if re.search(r'\b' + re.escape(alias_norm) + r'\b', normalized):
+    for fsli_category, patterns in _ALIAS_PATTERNS:
+        for pattern in patterns:
+            if pattern.search(normalized):
                 return fsli_category
 
     return None
@@ -237,15 +264,48 @@ def map_account_by_range(account_number: int,
     if pd.isna(account_number):
         return None
     
-    ranges = custom_ranges or DEFAULT_ACCOUNT_RANGES
+    if not custom_ranges:
+        pos = int(np.searchsorted(_DEFAULT_RANGE_STARTS, account_number, side='right')) - 1
+        if pos >= 0 and account_number <= _DEFAULT_RANGE_ENDS[pos]:
+            return _DEFAULT_RANGE_CATEGORIES[pos]
+        return None
     
-    for fsli_category, (range_start, range_end) in ranges.items():
+    for fsli_category, (range_start, range_end) in custom_ranges.items():
         if range_start <= account_number <= range_end:
             return fsli_category
     
     return None
 
 
+def map_accounts_by_range(account_numbers: pd.Series,
+                          custom_ranges: Optional[Dict] = None) -> pd.Series:
+    """
+    Vectorized map_account_by_range over a whole column.
+    Ranges are checked in order and the first match wins, as in the scalar version.
+    """
+    numbers = pd.to_numeric(account_numbers, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    result = np.full(len(numbers), None, dtype=object)
+
+    if not custom_ranges:
+        pos = np.searchsorted(_DEFAULT_RANGE_STARTS, numbers, side='right') - 1
+        # NaN sorts past every start, so its end check below is False as well
+        safe_pos = np.maximum(pos, 0)
+        hit = (pos >= 0) & (numbers <= _DEFAULT_RANGE_ENDS[safe_pos])
+        result[hit] = _DEFAULT_RANGE_CATEGORIES[safe_pos[hit]]
+        return pd.Series(result, index=account_numbers.index, dtype=object)
+
+    unmatched = ~np.isnan(numbers)
+
+    for fsli_category, (range_start, range_end) in custom_ranges.items():
+        if not unmatched.any():
+            break
+        hit = unmatched & (numbers >= range_start) & (numbers <= range_end)
+        result[hit] = fsli_category
+        unmatched &= ~hit
+
+    return pd.Series(result, index=account_numbers.index, dtype=object)
+
+
 def map_accounts(df: pd.DataFrame, 
                  custom_ranges: Optional[Dict] = None) -> pd.DataFrame:
     """
@@ -269,14 +329,17 @@ def map_accounts(df: pd.DataFrame,
     df['FSLI_Category'] = None
     
     # First pass: Name-based mapping
+    # (match each distinct name once; TB/GL repeat the same few account names on many rows)
     if 'AccountName' in df.columns:
-        df['FSLI_Category'] = df['AccountName'].apply(map_account_by_name)
+        names = df['AccountName']
+        name_map = {name: map_account_by_name(name) for name in names.dropna().unique()}
+        df['FSLI_Category'] = names.map(name_map)
     
     # Second pass: Range-based mapping for unmapped accounts
     if 'AccountNumber' in df.columns:
         unmapped = df['FSLI_Category'].isna()
-        df.loc[unmapped, 'FSLI_Category'] = df.loc[unmapped, 'AccountNumber'].apply(
-            lambda x: map_account_by_range(x, custom_ranges)
+        df.loc[unmapped, 'FSLI_Category'] = map_accounts_by_range(
+            df.loc[unmapped, 'AccountNumber'], custom_ranges
         )
     
     # Mark remaining as unclassified
@@ -293,10 +356,10 @@ def get_mapping_stats(df: pd.DataFrame) -> Dict:
         return {}
     
     total = len(df)
-    mapped = (df['FSLI_Category'] != 'unclassified').sum()
-    unclassified = (df['FSLI_Category'] == 'unclassified').sum()
-    
+    # One counting pass; mapped/unclassified are read off the category counts
     category_counts = df['FSLI_Category'].value_counts().to_dict()
+    unclassified = int(category_counts.get('unclassified', 0))
+    mapped = total - unclassified
     
     return {
         'total_accounts': total,
@@ -11,7 +11,87 @@ from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, Table,
                                 TableStyle, PageBreak, KeepTogether)
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
 import io
-from typing import Dict, List, Optional
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+
+# Report palette, parsed once and shared by the paragraph and table styles
+_TITLE_COLOR = colors.HexColor('#1a1a1a')
+_SUBTITLE_COLOR = colors.HexColor('#666666')
+_ACCENT_COLOR = colors.HexColor('#2c3e50')  # section headings and table header rows
+
+
+@lru_cache(maxsize=None)
+def _report_styles():
+    """
+    Sample stylesheet plus the report's custom title/subtitle/section styles.
+
+    The styles are static and only read during doc.build, so one instance is shared
+    by every report instead of being rebuilt on each export.
+    """
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=18,
+        textColor=_TITLE_COLOR,
+        spaceAfter=6,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ))
+    
+    styles.add(ParagraphStyle(
+        'CustomSubtitle',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=_SUBTITLE_COLOR,
+        spaceAfter=20,
+        alignment=TA_CENTER
+    ))
+    
+    styles.add(ParagraphStyle(
+        'SectionHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor=_ACCENT_COLOR,
+        spaceAfter=12,
+        spaceBefore=20,
+        fontName='Helvetica-Bold'
+    ))
+    
+    styles.add(ParagraphStyle(
+        'SummaryHeading',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=_ACCENT_COLOR,
+        spaceAfter=4,
+        fontName='Helvetica-Bold'
+    ))
+    return styles
+
+
+# Markdown heading line ("## Key Trends") at the start of a summary paragraph
+_SUMMARY_HEADING_RE = re.compile(r'^#{1,6}\s*(.+?)\s*#*$')
+
+
+def _summary_paragraphs(para: str, styles) -> List[Paragraph]:
+    """
+    Flowables for one blank-line-separated block of the AI summary.
+
+    The text is XML-escaped so '&' / '<' in model output cannot break ReportLab's
+    markup parser, and a leading markdown heading line gets its own style.
+    """
+    match = _SUMMARY_HEADING_RE.match(para.split('\n', 1)[0])
+    if match is None:
+        return [Paragraph(escape(para), styles['Normal'])]
+    
+    flowables = [Paragraph(escape(match.group(1)), styles['SummaryHeading'])]
+    body = para.partition('\n')[2].strip()
+    if body:
+        flowables.append(Paragraph(escape(body), styles['Normal']))
+    return flowables
 
 
 def create_pdf_report(financial_data: Dict[int, Dict],
@@ -38,36 +118,11 @@ def create_pdf_report(financial_data: Dict[int, Dict],
     # Container for elements
     elements = []
     
-    # Styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#1a1a1a'),
-        spaceAfter=6,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.HexColor('#666666'),
-        spaceAfter=20,
-        alignment=TA_CENTER
-    )
-    
-    section_style = ParagraphStyle(
-        'SectionHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceAfter=12,
-        spaceBefore=20,
-        fontName='Helvetica-Bold'
-    )
+    # Styles (built once per process, shared across reports)
+    styles = _report_styles()
+    title_style = styles['CustomTitle']
+    subtitle_style = styles['CustomSubtitle']
+    section_style = styles['SectionHeading']
     
     # Title
     elements.append(Paragraph(company_name, title_style))
@@ -78,23 +133,13 @@ def create_pdf_report(financial_data: Dict[int, Dict],
     all_years = sorted(financial_data.keys())
     years = all_years[1:] if len(all_years) > 1 else all_years
     
-    # Income Statement
-    elements.append(Paragraph("Income Statement", section_style))
-    is_table = create_income_statement_table(financial_data, years)
-    elements.append(is_table)
-    elements.append(Spacer(1, 0.3*inch))
-    
-    # Balance Sheet
-    elements.append(Paragraph("Balance Sheet", section_style))
-    bs_table = create_balance_sheet_table(financial_data, years)
-    elements.append(bs_table)
-    elements.append(Spacer(1, 0.3*inch))
-    
-    # Cash Flow Statement
-    if len(years) >= 1:
-        elements.append(Paragraph("Cash Flow Statement", section_style))
-        cf_table = create_cash_flow_table(financial_data, years)
-        elements.append(cf_table)
+    # Statements: derived subtotals are computed once per year and shared by all three tables
+    derived = {year: _derive_line_items(financial_data[year]) for year in years}
+    for title, build_table, min_years in _STATEMENT_SECTIONS:
+        if len(years) < min_years:
+            continue
+        elements.append(Paragraph(title, section_style))
+        elements.append(build_table(financial_data, years, derived=derived))
         elements.append(Spacer(1, 0.3*inch))
     
     # AI Summary (if provided)
@@ -103,10 +148,10 @@ def create_pdf_report(financial_data: Dict[int, Dict],
         elements.append(Paragraph("AI-Generated Summary & Insights", section_style))
         elements.append(Spacer(1, 0.1*inch))
         
-        # Split summary into paragraphs
-        for para in ai_summary.split('\n\n'):
-            if para.strip():
-                elements.append(Paragraph(para.strip(), styles['Normal']))
+        # Split summary into paragraphs (each stripped once; blanks skipped)
+        for para in (p.strip() for p in ai_summary.split('\n\n')):
+            if para:
+                elements.extend(_summary_paragraphs(para, styles))
                 elements.append(Spacer(1, 0.1*inch))
     
     # Build PDF
@@ -116,103 +161,213 @@ def create_pdf_report(financial_data: Dict[int, Dict],
     return buffer
 
 
+# Statement table styles: static, and only read by Table.setStyle, so each one is built
+# once at import and shared by every report. Treat them as read-only.
+_INCOME_STATEMENT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _ACCENT_COLOR),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('TOPPADDING', (0, 1), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+    # Bold for totals
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('LINEABOVE', (0, -1), (-1, -1), 1, colors.black),
+])
+
+_BALANCE_SHEET_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _ACCENT_COLOR),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('TOPPADDING', (0, 1), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('LINEABOVE', (0, -1), (-1, -1), 1, colors.black),
+])
+
+_CASH_FLOW_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _ACCENT_COLOR),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('TOPPADDING', (0, 1), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+    ('FONTNAME', (0, 13), (-1, 13), 'Helvetica-Bold'),
+    ('LINEABOVE', (0, 13), (-1, 13), 1, colors.black),
+])
+
+
+def _derive_line_items(d: Dict) -> Dict[str, float]:
+    """
+    Subtotals and sign-flipped lines shown in the PDF statements, computed once per year.
+
+    Each value uses the same expression (and evaluation order) as the per-cell lambdas it
+    replaces. Income-statement subtotals need 'revenue' and 'cogs'; when either is missing
+    they are left out and the table shows '—', as before.
+    """
+    total_opex = (d.get('distribution_expenses', 0) + 
+                  d.get('marketing_admin', 0) + 
+                  d.get('research_dev', 0) + 
+                  d.get('depreciation_expense', 0))
+    derived = {
+        'total_opex': total_opex,
+        'total_current_assets': (d.get('cash', 0) + 
+                                 d.get('accounts_receivable', 0) + 
+                                 d.get('inventory', 0) + 
+                                 d.get('prepaid_expenses', 0) + 
+                                 d.get('other_current_assets', 0)),
+        'accumulated_depreciation_contra': -d.get('accumulated_depreciation', 0),
+        'ppe_net': d.get('ppe_gross', 0) - d.get('accumulated_depreciation', 0),
+        'total_assets': (d.get('cash', 0) + d.get('accounts_receivable', 0) + 
+                         d.get('inventory', 0) + d.get('prepaid_expenses', 0) + 
+                         d.get('other_current_assets', 0) + d.get('ppe_gross', 0) - 
+                         d.get('accumulated_depreciation', 0)),
+        'total_current_liabilities': (d.get('accounts_payable', 0) + 
+                                      d.get('accrued_payroll', 0) + 
+                                      d.get('deferred_revenue', 0) + 
+                                      d.get('interest_payable', 0) + 
+                                      d.get('other_current_liabilities', 0) + 
+                                      d.get('income_taxes_payable', 0)),
+        'total_equity': d.get('common_stock', 0) + d.get('retained_earnings', 0),
+        'total_liabilities_and_equity': (d.get('accounts_payable', 0) + 
+                                         d.get('accrued_payroll', 0) + 
+                                         d.get('deferred_revenue', 0) + 
+                                         d.get('interest_payable', 0) + 
+                                         d.get('other_current_liabilities', 0) + 
+                                         d.get('income_taxes_payable', 0) + 
+                                         d.get('long_term_debt', 0) + 
+                                         d.get('common_stock', 0) + 
+                                         d.get('retained_earnings', 0)),
+        'dividends_paid': -d.get('dividends', 0),
+        'cash_from_financing': (d.get('stock_issuance', 0) - 
+                                d.get('dividends', 0) + 
+                                d.get('delta_debt', 0)),
+    }
+    
+    if 'revenue' in d and 'cogs' in d:
+        gross_profit = d['revenue'] - d['cogs']
+        ebit = gross_profit - total_opex
+        income_before_taxes = ebit - d.get('interest_expense', 0)
+        net_income = income_before_taxes - d.get('tax_expense', 0)
+        derived.update({
+            'gross_profit': gross_profit,
+            'ebit': ebit,
+            'income_before_taxes': income_before_taxes,
+            'net_income_calc': net_income,
+            'cash_from_operations': sum([
+                net_income,
+                d.get('depreciation_expense', 0),
+                d.get('delta_ar', 0),
+                d.get('delta_inventory', 0),
+                d.get('delta_prepaid', 0),
+                d.get('delta_other_current_assets', 0),
+                d.get('delta_ap', 0),
+                d.get('delta_accrued_payroll', 0),
+                d.get('delta_deferred_revenue', 0),
+                d.get('delta_interest_payable', 0),
+                d.get('delta_other_current_liabilities', 0),
+                d.get('delta_income_taxes_payable', 0),
+            ]),
+        })
+    return derived
+
+
+# Keys _derive_line_items can produce (a line item naming one never falls back to financial_data)
+_DERIVED_KEYS = frozenset({
+    'total_opex', 'total_current_assets', 'accumulated_depreciation_contra', 'ppe_net',
+    'total_assets', 'total_current_liabilities', 'total_equity', 'total_liabilities_and_equity',
+    'dividends_paid', 'cash_from_financing', 'gross_profit', 'ebit', 'income_before_taxes',
+    'net_income_calc', 'cash_from_operations',
+})
+
+
+def _statement_rows(financial_data: Dict[int, Dict], years: List[int],
+                    line_items: List[Tuple[str, Optional[str]]],
+                    derived: Optional[Dict[int, Dict[str, float]]] = None,
+                    dash_zero_inputs: bool = False) -> List[List[str]]:
+    """
+    Header + formatted rows for one statement table.
+
+    Derived lines are looked up in the per-year _derive_line_items dict (built once per
+    year, not once per cell; pass `derived` to share one across tables). With
+    dash_zero_inputs, a zero input line prints as '—'.
+    """
+    if derived is None:
+        derived = {year: _derive_line_items(financial_data[year]) for year in years}
+    
+    data = [['', *[str(year) for year in years]]]
+    blank_cells = [''] * len(years)
+    for label, key in line_items:
+        # Section headers and spacer rows carry no values: no per-year work
+        if key is None:
+            data.append([label, *blank_cells])
+        elif key in _DERIVED_KEYS:
+            values = (derived[year].get(key) for year in years)
+            data.append([label, *('—' if value is None else f'{value:,.1f}' for value in values)])
+        else:
+            values = (financial_data[year].get(key, 0) for year in years)
+            data.append([label, *(f'{value:,.1f}' if value != 0 or not dash_zero_inputs else '—'
+                                  for value in values)])
+    return data
+
+
 def create_income_statement_table(financial_data: Dict[int, Dict], 
-                                   years: List[int]) -> Table:
+                                   years: List[int],
+                                   derived: Optional[Dict[int, Dict[str, float]]] = None) -> Table:
     """Create Income Statement table"""
     
-    # Header row
-    header = ['', *[str(year) for year in years]]
-    
-    # Data rows
-    data = [header]
-    
-    # Add line items
     line_items = [
         ('Revenues', 'revenue'),
         ('Cost of Goods Sold', 'cogs'),
-        ('Gross Profit', lambda d: d['revenue'] - d['cogs']),
-        ('', None),  # Blank row
+        ('Gross Profit', 'gross_profit'),
+        ('', None),
         ('Operating Expenses:', None),
         ('  Distribution Expenses', 'distribution_expenses'),
         ('  Marketing and Administration', 'marketing_admin'),
         ('  Research and Development', 'research_dev'),
         ('  Depreciation', 'depreciation_expense'),
-        ('Total Operating Expenses', lambda d: (d.get('distribution_expenses', 0) + 
-                                                 d.get('marketing_admin', 0) + 
-                                                 d.get('research_dev', 0) + 
-                                                 d.get('depreciation_expense', 0))),
+        ('Total Operating Expenses', 'total_opex'),
         ('', None),
-        ('EBIT (Operating Profit)', lambda d: (d['revenue'] - d['cogs'] - 
-                                               (d.get('distribution_expenses', 0) + 
-                                                d.get('marketing_admin', 0) + 
-                                                d.get('research_dev', 0) + 
-                                                d.get('depreciation_expense', 0)))),
+        ('EBIT (Operating Profit)', 'ebit'),
         ('Interest Expense', 'interest_expense'),
-        ('Income Before Taxes', lambda d: (d['revenue'] - d['cogs'] - 
-                                           (d.get('distribution_expenses', 0) + 
-                                            d.get('marketing_admin', 0) + 
-                                            d.get('research_dev', 0) + 
-                                            d.get('depreciation_expense', 0)) - 
-                                           d.get('interest_expense', 0))),
+        ('Income Before Taxes', 'income_before_taxes'),
         ('Income Tax Expense', 'tax_expense'),
-        ('Net Income', lambda d: (d['revenue'] - d['cogs'] - 
-                                 (d.get('distribution_expenses', 0) + 
-                                  d.get('marketing_admin', 0) + 
-                                  d.get('research_dev', 0) + 
-                                  d.get('depreciation_expense', 0)) - 
-                                 d.get('interest_expense', 0) - 
-                                 d.get('tax_expense', 0))),
+        ('Net Income', 'net_income_calc'),
     ]
     
-    for label, key in line_items:
-        row = [label]
-        for year in years:
-            if key is None:
-                row.append('')
-            elif callable(key):
-                try:
-                    value = key(financial_data[year])
-                    row.append(f'{value:,.1f}')
-                except:
-                    row.append('—')
-            else:
-                value = financial_data[year].get(key, 0)
-                row.append(f'{value:,.1f}')
-        data.append(row)
+    data = _statement_rows(financial_data, years, line_items, derived=derived)
     
     # Create table
     table = Table(data, colWidths=[3*inch] + [1.2*inch]*len(years))
     
-    # Style
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('TOPPADDING', (0, 1), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-        # Bold for totals
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('LINEABOVE', (0, -1), (-1, -1), 1, colors.black),
-    ]))
+    table.setStyle(_INCOME_STATEMENT_TABLE_STYLE)
     
     return table
 
 
 def create_balance_sheet_table(financial_data: Dict[int, Dict], 
-                               years: List[int]) -> Table:
+                               years: List[int],
+                               derived: Optional[Dict[int, Dict[str, float]]] = None) -> Table:
     """Create Balance Sheet table"""
     
-    header = ['', *[str(year) for year in years]]
-    data = [header]
-    
     line_items = [
         ('ASSETS', None),
         ('Current Assets:', None),
@@ -221,21 +376,13 @@ def create_balance_sheet_table(financial_data: Dict[int, Dict],
         ('  Inventory', 'inventory'),
         ('  Prepaid Expenses', 'prepaid_expenses'),
         ('  Other Current Assets', 'other_current_assets'),
-        ('Total Current Assets', lambda d: (d.get('cash', 0) + 
-                                           d.get('accounts_receivable', 0) + 
-                                           d.get('inventory', 0) + 
-                                           d.get('prepaid_expenses', 0) + 
-                                           d.get('other_current_assets', 0))),
+        ('Total Current Assets', 'total_current_assets'),
         ('', None),
         ('Non-Current Assets:', None),
         ('  Property, Plant & Equipment - Gross', 'ppe_gross'),
-        ('  Less: Accumulated Depreciation', lambda d: -d.get('accumulated_depreciation', 0)),
-        ('  Property, Plant & Equipment - Net', lambda d: (d.get('ppe_gross', 0) - 
-                                                           d.get('accumulated_depreciation', 0))),
-        ('TOTAL ASSETS', lambda d: (d.get('cash', 0) + d.get('accounts_receivable', 0) + 
-                                   d.get('inventory', 0) + d.get('prepaid_expenses', 0) + 
-                                   d.get('other_current_assets', 0) + d.get('ppe_gross', 0) - 
-                                   d.get('accumulated_depreciation', 0))),
+        ('  Less: Accumulated Depreciation', 'accumulated_depreciation_contra'),
+        ('  Property, Plant & Equipment - Net', 'ppe_net'),
+        ('TOTAL ASSETS', 'total_assets'),
         ('', None),
         ('LIABILITIES AND EQUITY', None),
         ('Current Liabilities:', None),
@@ -245,86 +392,36 @@ def create_balance_sheet_table(financial_data: Dict[int, Dict],
         ('  Interest Payable', 'interest_payable'),
         ('  Other Current Liabilities', 'other_current_liabilities'),
         ('  Income Taxes Payable', 'income_taxes_payable'),
-        ('Total Current Liabilities', lambda d: (d.get('accounts_payable', 0) + 
-                                                d.get('accrued_payroll', 0) + 
-                                                d.get('deferred_revenue', 0) + 
-                                                d.get('interest_payable', 0) + 
-                                                d.get('other_current_liabilities', 0) + 
-                                                d.get('income_taxes_payable', 0))),
+        ('Total Current Liabilities', 'total_current_liabilities'),
         ('', None),
         ('Non-Current Liabilities:', None),
         ('  Long-Term Debt', 'long_term_debt'),
         ('', None),
-        ('Shareholders\' Equity:', None),
+        ("Shareholders' Equity:", None),
         ('  Common Stock and APIC', 'common_stock'),
         ('  Retained Earnings', 'retained_earnings'),
-        ('Total Shareholders\' Equity', lambda d: (d.get('common_stock', 0) + 
-                                                   d.get('retained_earnings', 0))),
+        ("Total Shareholders' Equity", 'total_equity'),
         ('', None),
-        ('TOTAL LIABILITIES AND EQUITY', lambda d: (d.get('accounts_payable', 0) + 
-                                                   d.get('accrued_payroll', 0) + 
-                                                   d.get('deferred_revenue', 0) + 
-                                                   d.get('interest_payable', 0) + 
-                                                   d.get('other_current_liabilities', 0) + 
-                                                   d.get('income_taxes_payable', 0) + 
-                                                   d.get('long_term_debt', 0) + 
-                                                   d.get('common_stock', 0) + 
-                                                   d.get('retained_earnings', 0))),
+        ('TOTAL LIABILITIES AND EQUITY', 'total_liabilities_and_equity'),
     ]
     
-    for label, key in line_items:
-        row = [label]
-        for year in years:
-            if key is None:
-                row.append('')
-            elif callable(key):
-                try:
-                    value = key(financial_data[year])
-                    row.append(f'{value:,.1f}')
-                except:
-                    row.append('—')
-            else:
-                value = financial_data[year].get(key, 0)
-                row.append(f'{value:,.1f}')
-        data.append(row)
+    data = _statement_rows(financial_data, years, line_items, derived=derived)
     
     table = Table(data, colWidths=[3*inch] + [1.2*inch]*len(years))
     
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('TOPPADDING', (0, 1), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('LINEABOVE', (0, -1), (-1, -1), 1, colors.black),
-    ]))
+    table.setStyle(_BALANCE_SHEET_TABLE_STYLE)
     
     return table
 
 
 def create_cash_flow_table(financial_data: Dict[int, Dict], 
-                           years: List[int]) -> Table:
+                           years: List[int],
+                           derived: Optional[Dict[int, Dict[str, float]]] = None) -> Table:
     """Create Cash Flow Statement table (indirect method)"""
     
-    header = ['', *[str(year) for year in years]]
-    data = [header]
-    
     line_items = [
         ('Operating Activities:', None),
-        ('  Net Income', lambda d: (d['revenue'] - d['cogs'] - 
-                                   (d.get('distribution_expenses', 0) + 
-                                    d.get('marketing_admin', 0) + 
-                                    d.get('research_dev', 0) + 
-                                    d.get('depreciation_expense', 0)) - 
-                                   d.get('interest_expense', 0) - 
-                                   d.get('tax_expense', 0))),
+        ('  Net Income', 'net_income_calc'),
         ('  Depreciation', 'depreciation_expense'),
         ('  Change in Accounts Receivable', 'delta_ar'),
         ('  Change in Inventory', 'delta_inventory'),
@@ -336,24 +433,7 @@ def create_cash_flow_table(financial_data: Dict[int, Dict],
         ('  Change in Interest Payable', 'delta_interest_payable'),
         ('  Change in Other Current Liabilities', 'delta_other_current_liabilities'),
         ('  Change in Income Taxes Payable', 'delta_income_taxes_payable'),
-        ('Cash from Operating Activities', lambda d: sum([
-            d['revenue'] - d['cogs'] - (d.get('distribution_expenses', 0) + 
-                                       d.get('marketing_admin', 0) + 
-                                       d.get('research_dev', 0) + 
-                                       d.get('depreciation_expense', 0)) - 
-            d.get('interest_expense', 0) - d.get('tax_expense', 0),
-            d.get('depreciation_expense', 0),
-            d.get('delta_ar', 0),
-            d.get('delta_inventory', 0),
-            d.get('delta_prepaid', 0),
-            d.get('delta_other_current_assets', 0),
-            d.get('delta_ap', 0),
-            d.get('delta_accrued_payroll', 0),
-            d.get('delta_deferred_revenue', 0),
-            d.get('delta_interest_payable', 0),
-            d.get('delta_other_current_liabilities', 0),
-            d.get('delta_income_taxes_payable', 0),
-        ])),
+        ('Cash from Operating Activities', 'cash_from_operations'),
         ('', None),
         ('Investing Activities:', None),
         ('  Acquisitions of PP&E', 'capex'),
@@ -361,48 +441,27 @@ def create_cash_flow_table(financial_data: Dict[int, Dict],
         ('', None),
         ('Financing Activities:', None),
         ('  Issuance of Common Stock', 'stock_issuance'),
-        ('  Dividends', lambda d: -d.get('dividends', 0)),
+        ('  Dividends', 'dividends_paid'),
         ('  Change in Long-Term Debt', 'delta_debt'),
-        ('Cash from Financing Activities', lambda d: (d.get('stock_issuance', 0) - 
-                                                     d.get('dividends', 0) + 
-                                                     d.get('delta_debt', 0))),
+        ('Cash from Financing Activities', 'cash_from_financing'),
     ]
     
-    for label, key in line_items:
-        row = [label]
-        for year in years:
-            if key is None:
-                row.append('')
-            elif callable(key):
-                try:
-                    value = key(financial_data[year])
-                    row.append(f'{value:,.1f}')
-                except:
-                    row.append('—')
-            else:
-                value = financial_data[year].get(key, 0)
-                row.append(f'{value:,.1f}' if value != 0 else '—')
-        data.append(row)
+    data = _statement_rows(financial_data, years, line_items, derived=derived,
+                           dash_zero_inputs=True)
     
     table = Table(data, colWidths=[3*inch] + [1.2*inch]*len(years))
     
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('TOPPADDING', (0, 1), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-        ('FONTNAME', (0, 13), (-1, 13), 'Helvetica-Bold'),
-        ('LINEABOVE', (0, 13), (-1, 13), 1, colors.black),
-    ]))
+    table.setStyle(_CASH_FLOW_TABLE_STYLE)
     
     return table
 
+
+# (section title, table builder, minimum number of statement years) in report order
+_STATEMENT_SECTIONS = (
+    ("Income Statement", create_income_statement_table, 0),
+    ("Balance Sheet", create_balance_sheet_table, 0),
+    ("Cash Flow Statement", create_cash_flow_table, 1),
+)
+
 # Alias for backwards compatibility
 generate_pdf_report = create_pdf_report
\ No newline at end of file
@@ -16,31 +16,54 @@ from __future__ import annotations
 
 import os
 import random
+import re
+from functools import lru_cache
 from typing import List, Tuple, Optional, Dict
 
 import pandas as pd
 
+from validation import normalize_column_headers
 
-def get_sample_data_path(filename: str) -> str:
+
+@lru_cache(maxsize=None)
+def _asset_index(subdir: str) -> Dict[str, str]:
     """
-    Resolve a sample/backup data file path by checking common locations.
+    {filename: path} for the asset lookup locations, scanned once per process.
+
+    Directories are listed in resolution priority order and the first hit for a name
+    wins, so lookups resolve exactly as probing each candidate path in turn did
+    (one scandir per directory instead of a stat per candidate per lookup).
+    Call _asset_index.cache_clear() if asset files change on disk at runtime.
     """
     base_dir = os.path.dirname(__file__)
-
-    possible_paths = [
-        os.path.join(base_dir, filename),
-        os.path.join(base_dir, "assets", "sample_data", filename),
-        os.path.join("assets", "sample_data", filename),
-        os.path.join("accounting_app", "assets", "sample_data", filename),
-        os.path.join("/home/claude/accounting_app", "assets", "sample_data", filename),
-        filename,  # current directory
+    directories = [
+        base_dir,
+        os.path.join(base_dir, "assets", subdir),
+        os.path.join("assets", subdir),
+        os.path.join("accounting_app", "assets", subdir),
+        os.path.join("/home/claude/accounting_app", "assets", subdir),
+        "",  # current directory
     ]
 
-    for path in possible_paths:
-        if os.path.exists(path):
-            return path
+    index: Dict[str, str] = {}
+    for d in directories:
+        try:
+            with os.scandir(d or ".") as entries:
+                for entry in entries:
+                    index.setdefault(entry.name, os.path.join(d, entry.name))
+        except OSError:
+            continue
+    return index
 
-    raise FileNotFoundError(f"Sample/backup data file not found: {filename}")
+
+def get_sample_data_path(filename: str) -> str:
+    """
+    Resolve a sample/backup data file path by checking common locations.
+    """
+    path = _asset_index("sample_data").get(filename)
+    if path is None:
+        raise FileNotFoundError(f"Sample/backup data file not found: {filename}")
+    return path
 
 
 def _list_dir_candidates() -> List[str]:
@@ -64,6 +87,10 @@ def _list_dir_candidates() -> List[str]:
     return []
 
 
+# TB pack filename -> (start_year, end_year), e.g. backup_tb_2020_2022.csv
+_BACKUP_TB_RE = re.compile(r"backup_tb_(\d+)_(\d+)\.csv")
+
+
 def list_backup_sets(require_with_txnid: bool = True) -> List[Tuple[int, int]]:
     """
     Discover available backup packs by scanning filenames.
@@ -80,15 +107,11 @@ def list_backup_sets(require_with_txnid: bool = True) -> List[Tuple[int, int]]:
     sets = set()
 
     for fn in files:
-        if not fn.startswith("backup_tb_") or not fn.endswith(".csv"):
-            continue
         # backup_tb_2020_2022.csv
-        try:
-            core = fn.replace("backup_tb_", "").replace(".csv", "")
-            y0, y1 = core.split("_")
-            y0, y1 = int(y0), int(y1)
-        except Exception:
+        match = _BACKUP_TB_RE.fullmatch(fn)
+        if match is None:
             continue
+        y0, y1 = int(match.group(1)), int(match.group(2))
 
         tb_name = f"backup_tb_{y0}_{y1}.csv"
         gl_name = f"backup_gl_{y0}_{y1}_{'with_txnid' if require_with_txnid else 'no_txnid'}.csv"
@@ -103,6 +126,45 @@ def list_backup_sets(require_with_txnid: bool = True) -> List[Tuple[int, int]]:
     return sorted(list(sets))
 
 
+# Date columns pinned to str, keyed on the normalized header (missing columns are
+# ignored). Left to itself pyarrow turns them into date objects; every other column is
+# inferred the same way the default parser does, so the frames match pd.read_csv.
+_CSV_DTYPES = {
+    "TxnDate": "str",
+    "PeriodEnd": "str",
+}
+
+
+def read_data_csv(source) -> pd.DataFrame:
+    """
+    Read a TB/GL CSV (path or file-like) with pandas' pyarrow engine (multi-threaded parser).
+
+    The dtype hints are matched through normalize_column_headers, so aliased headers
+    (e.g. "date", "transaction_date") are pinned like their canonical names. Falls back
+    to the default C parser when pyarrow is not installed, rejects the file (e.g. ragged
+    rows or non-numeric amounts) or still infers dates in an unpinned column.
+    """
+    header = pd.read_csv(source, nrows=0)
+    if hasattr(source, "seek"):
+        source.seek(0)
+    canonical = normalize_column_headers(header).columns
+    dtype = {raw: _CSV_DTYPES[name] for raw, name in zip(header.columns, canonical) if name in _CSV_DTYPES}
+
+    try:
+        df = pd.read_csv(source, engine="pyarrow", dtype=dtype)
+        if not any(
+            pd.api.types.is_datetime64_any_dtype(col)
+            or (col.dtype == object and pd.api.types.infer_dtype(col, skipna=True) == "date")
+            for _, col in df.items()
+        ):
+            return df
+    except (ImportError, ValueError):
+        pass
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return pd.read_csv(source)
+
+
 def load_backup_set(start_year: int, end_year: int, with_txnid: bool = True) -> Tuple[pd.DataFrame, pd.DataFrame, str]:
     """
     Load a specific backup TB+GL set.
@@ -110,8 +172,8 @@ def load_backup_set(start_year: int, end_year: int, with_txnid: bool = True) ->
     tb_file = f"backup_tb_{start_year}_{end_year}.csv"
     gl_file = f"backup_gl_{start_year}_{end_year}_{'with_txnid' if with_txnid else 'no_txnid'}.csv"
 
-    tb_df = pd.read_csv(get_sample_data_path(tb_file))
-    gl_df = pd.read_csv(get_sample_data_path(gl_file))
+    tb_df = read_data_csv(get_sample_data_path(tb_file))
+    gl_df = read_data_csv(get_sample_data_path(gl_file))
     return tb_df, gl_df, f"{start_year}_{end_year}"
 
 
@@ -140,24 +202,12 @@ def get_template_path(template_type: str = "zero") -> str:
       - 'zero' -> processing template (TEMPLATE_ZERO)
       - 'demo' -> sample demo template (SAMPLE_DEMO)
     """
-    base_dir = os.path.dirname(__file__)
-
     if template_type == "zero":
         filename = "Financial_Model_TEMPLATE_ZERO_USD_thousands_GAAP.xlsx"
     else:
         filename = "Financial_Model_SAMPLE_DEMO_USD_thousands_GAAP.xlsx"
 
-    possible_paths = [
-        os.path.join(base_dir, filename),
-        os.path.join(base_dir, "assets", "templates", filename),
-        os.path.join("assets", "templates", filename),
-        os.path.join("accounting_app", "assets", "templates", filename),
-        os.path.join("/home/claude/accounting_app", "assets", "templates", filename),
-        filename,
-    ]
-
-    for path in possible_paths:
-        if os.path.exists(path):
-            return path
-
-    raise FileNotFoundError(f"Template file not found: {filename}")
+    path = _asset_index("templates").get(filename)
+    if path is None:
+        raise FileNotFoundError(f"Template file not found: {filename}")
+    return path
@@ -9,9 +9,13 @@ Focus:
   3) Load Random Sample Set (TB+GL together, matched years)
 """
 
+import hashlib
 import io
+import queue
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
 import pandas as pd
 import openpyxl
@@ -32,8 +36,7 @@ from excel_writer import (
     write_financial_data_to_template,
     compute_reconciliation_checks,
 )
-from sample_data import get_sample_data_path, get_template_path
-from pdf_export import generate_pdf_report
+from sample_data import get_template_path, load_backup_set, read_data_csv
 from ai_summary import generate_ai_summary
 import os
 
@@ -73,11 +76,58 @@ for k, default in {
     "dataset_source": None,  # 'random' or 'upload'
     "preview_sections": {},
     "last_excel_bytes": None,
+    "tb_upload_key": None,  # content hash of the TB upload currently loaded
+    "gl_upload_key": None,
 }.items():
     if k not in st.session_state:
         st.session_state[k] = default
 
 
+@st.cache_data(show_spinner=False, max_entries=8, ttl=3600)
+def _load_uploaded_csv(data: bytes) -> pd.DataFrame:
+    """Parse uploaded CSV bytes (cached by content, so re-uploads of the same file are free)."""
+    return read_data_csv(io.BytesIO(data))
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Exact content hash of a DataFrame (columns, dtypes, index and every cell).
+
+    st.cache_data's own DataFrame hasher samples large frames, so an edit to an
+    unsampled row would otherwise be served the stale cached result.
+    """
+    h = hashlib.sha256(repr((list(df.columns), [str(t) for t in df.dtypes])).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=3600)
+def _build_financial_data(data_key: str, _tb_df: pd.DataFrame, _gl_df: pd.DataFrame) -> dict:
+    """
+    Map accounts and compute the 3-statement data.
+
+    Cached on data_key (the TB/GL fingerprints); the frames themselves are not hashed.
+    """
+    tb_mapped = map_accounts(_tb_df)
+    gl_mapped = map_accounts(_gl_df)
+    return calculate_3statements_from_tb_gl(tb_mapped, gl_mapped)
+
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=3600)
+def _build_excel_output(template_path: str, data_key: str, _financial_data: dict, unit_scale: float) -> bytes:
+    """
+    Fill the template and return the workbook bytes.
+
+    Cached on the same data_key as _build_financial_data, so regenerating unchanged
+    data skips openpyxl and changed data never reuses a stale workbook.
+    """
+    return write_financial_data_to_template(
+        template_path=template_path,
+        financial_data=_financial_data,
+        unit_scale=unit_scale,
+    ).getvalue()
+
+
 def _issues_to_table(issues):
     """Compact table for issue list."""
     rows = []
@@ -103,10 +153,17 @@ def _count_by_severity(issues):
     return counts
 
 
-def _find_row_exact(ws, label: str, start_row: int = 1, end_row: int = 200):
+def _column_values(ws, col: int = 1, end_row: int = 220) -> list:
+    """Read one column in a single pass; index i holds the value of row i (index 0 unused)."""
+    values = [None]
+    values.extend(row[0] for row in ws.iter_rows(min_row=1, max_row=end_row, min_col=col, max_col=col, values_only=True))
+    return values
+
+
+def _find_row_exact(col_values: list, label: str, start_row: int = 1, end_row: int = 200):
     target = str(label).strip().lower()
-    for r in range(start_row, end_row + 1):
-        v = ws.cell(r, 1).value
+    for r in range(start_row, min(end_row, len(col_values) - 1) + 1):
+        v = col_values[r]
         if v is None:
             continue
         if str(v).strip().lower() == target:
@@ -114,10 +171,10 @@ def _find_row_exact(ws, label: str, start_row: int = 1, end_row: int = 200):
     return None
 
 
-def _extract_labels(ws, start_row: int, end_row: int) -> list[str]:
+def _extract_labels(col_values: list, start_row: int, end_row: int) -> list[str]:
     labels = []
     for r in range(start_row, end_row + 1):
-        v = ws.cell(r, 1).value
+        v = col_values[r] if r < len(col_values) else None
         if v is None:
             labels.append("")
         else:
@@ -138,6 +195,8 @@ def _compute_template_preview_sections(financial_data: dict, template_path: str,
 
     wb = openpyxl.load_workbook(template_path, data_only=False)
     ws = wb["Blank 3 Statement Model"] if "Blank 3 Statement Model" in wb.sheetnames else wb[wb.sheetnames[0]]
+    # Every lookup below reads column A only, so fetch it once instead of cell by cell
+    col_a = _column_values(ws, col=1, end_row=220)
 
     years_all = sorted(financial_data.keys())
     stmt_years = years_all[1:] if len(years_all) > 1 else years_all  # hide Year0 in preview
@@ -149,41 +208,58 @@ def _compute_template_preview_sections(financial_data: dict, template_path: str,
         except Exception:
             return 0.0
 
-    # Derived calculations (match template logic)
+    # Derived calculations (match template logic).
+    # Totals build on each other (end_cash -> cfo -> net_income -> ebt -> ...), so each is memoized per year.
+    @lru_cache(maxsize=None)
     def gross_profit(y): return v(y, "revenue") - v(y, "cogs")
+    @lru_cache(maxsize=None)
     def total_opex(y): 
         return v(y,"distribution_expenses")+v(y,"marketing_admin")+v(y,"research_dev")+v(y,"depreciation_expense")
+    @lru_cache(maxsize=None)
     def ebit(y): return gross_profit(y) - total_opex(y)
+    @lru_cache(maxsize=None)
     def ebt(y): return ebit(y) - v(y,"interest_expense")
+    @lru_cache(maxsize=None)
     def net_income(y): 
         # prefer calculated if present, else compute
         ni = v(y,"net_income")
         return ni if abs(ni) > 1e-9 else (ebt(y) - v(y,"tax_expense"))
 
+    @lru_cache(maxsize=None)
     def total_current_assets(y):
         return v(y,"cash")+v(y,"accounts_receivable")+v(y,"inventory")+v(y,"prepaid_expenses")+v(y,"other_current_assets")
+    @lru_cache(maxsize=None)
     def net_ppe(y):
         return v(y,"ppe_gross") - v(y,"accumulated_depreciation")
+    @lru_cache(maxsize=None)
     def total_assets(y):
         return total_current_assets(y) + net_ppe(y)
 
+    @lru_cache(maxsize=None)
     def total_current_liab(y):
         return (v(y,"accounts_payable")+v(y,"accrued_payroll")+v(y,"deferred_revenue")+
                 v(y,"interest_payable")+v(y,"other_current_liabilities")+v(y,"income_taxes_payable"))
+    @lru_cache(maxsize=None)
     def total_equity(y):
         return v(y,"common_stock") + v(y,"retained_earnings")
+    @lru_cache(maxsize=None)
     def total_le(y):
         return total_current_liab(y) + v(y,"long_term_debt") + total_equity(y)
 
     # Cash Flow
+    @lru_cache(maxsize=None)
     def cfo(y):
         return (net_income(y) + v(y,"depreciation_expense") +
                 v(y,"delta_ar")+v(y,"delta_inventory")+v(y,"delta_prepaid")+v(y,"delta_other_current_assets")+
                 v(y,"delta_ap")+v(y,"delta_accrued_payroll")+v(y,"delta_deferred_revenue")+v(y,"delta_interest_payable")+
                 v(y,"delta_other_current_liabilities")+v(y,"delta_income_taxes_payable"))
+    @lru_cache(maxsize=None)
     def cfi(y): return v(y,"capex")
+    @lru_cache(maxsize=None)
     def cff(y): return v(y,"stock_issuance") + (-v(y,"dividends")) + v(y,"delta_debt")
+    @lru_cache(maxsize=None)
     def net_change_cash(y): return cfo(y) + cfi(y) + cff(y)
+    @lru_cache(maxsize=None)
     def begin_cash(y):
         bc = v(y, "beginning_cash")
         if bc != 0:
@@ -194,6 +270,7 @@ def _compute_template_preview_sections(financial_data: dict, template_path: str,
             prev = year0 if idx == 0 else stmt_years[idx - 1]
             return v(prev, "cash")
         return 0.0
+    @lru_cache(maxsize=None)
     def end_cash(y):
         # prefer key if exists, else compute
         ec = v(y,"cash")
@@ -207,86 +284,81 @@ def _compute_template_preview_sections(financial_data: dict, template_path: str,
     # Map template label -> internal key (reverse mapping)
     label_to_key = TEMPLATE_LABEL_MAPPING
 
-    # Build a section DataFrame from template row range
+    # Derived / total rows (match template logic)
+    derived = {
+        "Gross Profit": gross_profit,
+        "EBIT (Operating Profit)": ebit,
+        "Income Before Taxes": ebt,
+        "Net Income": net_income,
+        "Total Current Assets": total_current_assets,
+        "Property Plant and Equipment - Net": net_ppe,
+        "TOTAL ASSETS": total_assets,
+        "Total Current Liabilities:": total_current_liab,
+        "Total Shareholders' Equity": total_equity,
+        "TOTAL LIABILITIES AND SHAREHOLDERS' EQUITY": total_le,
+        "Net Cash Provided by Operating Activities": cfo,
+        "Cash Flows from Investing Activities": cfi,
+        "Cash Flows from Financing Activities": cff,
+        "Increase/(Decrease) in Cash and Equivalents": net_change_cash,
+        "Cash and Equivalents, Beginning of the Year": begin_cash,
+        "Cash and Equivalents, End of the Year": end_cash,
+        # Checks (these rows are outside the sections, but safe)
+        "Balance Sheet Check (A - L + E)": bs_check,
+        "Check": cf_check,
+    }
+
+    # Headings / section labels should stay blank; unmapped numeric rows show 0 to avoid "missing statement" look
+    heading_labels = {
+        "ASSETS", "LIABILITIES AND SHAREHOLDERS' EQUITY",
+        "Current Assets:", "Non-Current Assets:", "Current Liabilities:",
+        "Non-Current Liabilities:", "Shareholder's Equity:",
+        "Cash Flow Statement", "Cash Flows from Operating Activities:",
+        "Changes in Operating Assets and Liabilities:", "Investing Activities:",
+        "Financing Activities:",
+        "Revenues", "Operating Expenses", "Other Expense / (Income)", "Taxes",
+    }
+
+    def is_heading(lab: str) -> bool:
+        if (lab in heading_labels) or (lab.endswith(":") and not lab.lower().startswith("total")):
+            return True
+        # Some templates use ALL CAPS for section headers; do NOT treat totals as headings (handled above in derived).
+        return lab.upper() == lab and lab not in {"TOTAL ASSETS", "TOTAL LIABILITIES AND SHAREHOLDERS' EQUITY"}
+
+    # Build a section DataFrame from template row range.
+    # Each label is classified once and its row filled across all years in a preallocated array.
     def build_df(row_start: int, row_end: int) -> pd.DataFrame:
-        labels = _extract_labels(ws, row_start, row_end)
-        data = {}
-        for y in stmt_years:
-            col = []
-            for lab in labels:
-                if lab == "":
-                    col.append(np.nan)
-                    continue
-
+        labels = _extract_labels(col_a, row_start, row_end)
+        values = np.empty((len(labels), len(stmt_years)), dtype=np.float64)
 
+        for i, lab in enumerate(labels):
+            if lab == "":
+                values[i, :] = np.nan
+            elif lab in label_to_key:
                 # Direct mapped inputs
-                if lab in label_to_key:
-                    col.append(v(y, label_to_key[lab]))
-                    continue
-
-                # Derived / totals
-                derived = {
-                    "Gross Profit": gross_profit,
-                    "EBIT (Operating Profit)": ebit,
-                    "Income Before Taxes": ebt,
-                    "Net Income": net_income,
-                    "Total Current Assets": total_current_assets,
-                    "Property Plant and Equipment - Net": net_ppe,
-                    "TOTAL ASSETS": total_assets,
-                    "Total Current Liabilities:": total_current_liab,
-                    "Total Shareholders' Equity": total_equity,
-                    "TOTAL LIABILITIES AND SHAREHOLDERS' EQUITY": total_le,
-                    "Net Cash Provided by Operating Activities": cfo,
-                    "Cash Flows from Investing Activities": cfi,
-                    "Cash Flows from Financing Activities": cff,
-                    "Increase/(Decrease) in Cash and Equivalents": net_change_cash,
-                    "Cash and Equivalents, Beginning of the Year": begin_cash,
-                    "Cash and Equivalents, End of the Year": end_cash,
-                    # Checks (these rows are outside the sections, but safe)
-                    "Balance Sheet Check (A - L + E)": bs_check,
-                    "Check": cf_check,
-                }
-                if lab in derived:
-                    col.append(float(derived[lab](y)))
-                    continue
-
-
-                # Headings / section labels should stay blank; unmapped numeric rows show 0 to avoid "missing statement" look
-                heading_labels = {
-                    "ASSETS", "LIABILITIES AND SHAREHOLDERS' EQUITY",
-                    "Current Assets:", "Non-Current Assets:", "Current Liabilities:",
-                    "Non-Current Liabilities:", "Shareholder's Equity:",
-                    "Cash Flow Statement", "Cash Flows from Operating Activities:",
-                    "Changes in Operating Assets and Liabilities:", "Investing Activities:",
-                    "Financing Activities:",
-                    "Revenues", "Operating Expenses", "Other Expense / (Income)", "Taxes",
-                }
-                is_heading = (lab in heading_labels) or (lab.endswith(":") and not lab.lower().startswith("total"))
-                # Some templates use ALL CAPS for section headers; do NOT treat totals as headings (handled above in derived).
-                is_heading = is_heading or (lab.upper() == lab and lab not in {"TOTAL ASSETS", "TOTAL LIABILITIES AND SHAREHOLDERS' EQUITY"})
-
-                if is_heading:
-                    col.append(np.nan)
-                else:
-                    col.append(0.0)
-
-            data[f"FY{y}"] = col
-
-        df = pd.DataFrame(data, index=labels)
-        return df
+                key = label_to_key[lab]
+                values[i, :] = [v(y, key) for y in stmt_years]
+            elif lab in derived:
+                fn = derived[lab]
+                values[i, :] = [float(fn(y)) for y in stmt_years]
+            elif is_heading(lab):
+                values[i, :] = np.nan
+            else:
+                values[i, :] = 0.0
+
+        return pd.DataFrame(values, index=labels, columns=[f"FY{y}" for y in stmt_years])
 
     # Find row ranges by labels (use the template's second 'Income Statement' section for actual output)
-    is_header = _find_row_exact(ws, "Income Statement", start_row=25, end_row=120)  # should find row 30
-    is_start = _find_row_exact(ws, "Revenues", start_row=is_header or 1, end_row=140)
-    is_end = _find_row_exact(ws, "Common Dividends", start_row=is_start or 1, end_row=160)
+    is_header = _find_row_exact(col_a, "Income Statement", start_row=25, end_row=120)  # should find row 30
+    is_start = _find_row_exact(col_a, "Revenues", start_row=is_header or 1, end_row=140)
+    is_end = _find_row_exact(col_a, "Common Dividends", start_row=is_start or 1, end_row=160)
 
-    bs_header = _find_row_exact(ws, "Balance Sheet", start_row=40, end_row=120)  # should find row 48
-    bs_start = _find_row_exact(ws, "ASSETS", start_row=bs_header or 1, end_row=200)
-    bs_end = _find_row_exact(ws, "Check", start_row=bs_start or 1, end_row=140)  # row 81 (check line)
+    bs_header = _find_row_exact(col_a, "Balance Sheet", start_row=40, end_row=120)  # should find row 48
+    bs_start = _find_row_exact(col_a, "ASSETS", start_row=bs_header or 1, end_row=200)
+    bs_end = _find_row_exact(col_a, "Check", start_row=bs_start or 1, end_row=140)  # row 81 (check line)
 
-    cf_header = _find_row_exact(ws, "Cash Flow Statement", start_row=70, end_row=160)  # row 84
-    cf_start = _find_row_exact(ws, "Cash Flows from Operating Activities:", start_row=cf_header or 1, end_row=200)
-    cf_end = _find_row_exact(ws, "Cash and Equivalents, End of the Year", start_row=cf_start or 1, end_row=220)
+    cf_header = _find_row_exact(col_a, "Cash Flow Statement", start_row=70, end_row=160)  # row 84
+    cf_start = _find_row_exact(col_a, "Cash Flows from Operating Activities:", start_row=cf_header or 1, end_row=200)
+    cf_end = _find_row_exact(col_a, "Cash and Equivalents, End of the Year", start_row=cf_start or 1, end_row=220)
 
     sections = {}
 
@@ -338,11 +410,7 @@ def load_random_set():
     tb_file = f"backup_tb_{y0}_{y1}.csv"
     gl_file = f"backup_gl_{y0}_{y1}_with_txnid.csv"
 
-    tb_path = get_sample_data_path(tb_file)
-    gl_path = get_sample_data_path(gl_file)
-
-    tb_df = pd.read_csv(tb_path)
-    gl_df = pd.read_csv(gl_path)
+    tb_df, gl_df, _ = load_backup_set(y0, y1, with_txnid=True)
 
     st.session_state["tb_df"] = tb_df
     st.session_state["gl_df"] = gl_df
@@ -410,19 +478,35 @@ with st.sidebar:
     tb_up = st.file_uploader("Upload TB (CSV)", type=["csv"], key="tb_uploader")
     gl_up = st.file_uploader("Upload GL (CSV)", type=["csv"], key="gl_uploader")
 
+    # The uploader keeps returning the same file on every rerun; only (re)load and
+    # re-validate when its content changes, so reruns are cheap and applied fixes stick.
     if tb_up is not None:
-        st.session_state["tb_df"] = pd.read_csv(tb_up)
-        st.session_state["tb_name"] = getattr(tb_up, "name", "tb.csv")
-        st.session_state["tb_changes"] = []
-        st.session_state["dataset_source"] = "upload"
-        run_validation()
+        tb_bytes = tb_up.getvalue()
+        tb_key = hashlib.sha256(tb_bytes).hexdigest()
+        if st.session_state["tb_upload_key"] != tb_key:
+            st.session_state["tb_df"] = _load_uploaded_csv(tb_bytes)
+            st.session_state["tb_name"] = getattr(tb_up, "name", "tb.csv")
+            st.session_state["tb_changes"] = []
+            st.session_state["dataset_source"] = "upload"
+            st.session_state["tb_upload_key"] = tb_key
+            run_validation()
+    else:
+        # Uploader cleared: forget the key so re-uploading the same file loads it again.
+        st.session_state["tb_upload_key"] = None
 
     if gl_up is not None:
-        st.session_state["gl_df"] = pd.read_csv(gl_up)
-        st.session_state["gl_name"] = getattr(gl_up, "name", "gl.csv")
-        st.session_state["gl_changes"] = []
-        st.session_state["dataset_source"] = "upload"
-        run_validation()
+        gl_bytes = gl_up.getvalue()
+        gl_key = hashlib.sha256(gl_bytes).hexdigest()
+        if st.session_state["gl_upload_key"] != gl_key:
+            st.session_state["gl_df"] = _load_uploaded_csv(gl_bytes)
+            st.session_state["gl_name"] = getattr(gl_up, "name", "gl.csv")
+            st.session_state["gl_changes"] = []
+            st.session_state["dataset_source"] = "upload"
+            st.session_state["gl_upload_key"] = gl_key
+            run_validation()
+    else:
+        # Uploader cleared: forget the key so re-uploading the same file loads it again.
+        st.session_state["gl_upload_key"] = None
 
     st.divider()
     st.header("Settings")
@@ -602,23 +686,44 @@ if st.button("Generate 3-Statement Outputs", type="primary"):
                 st.error("Strict mode: Year0 opening snapshot requirement failed:\n" + "\n".join(year0_issues))
                 st.stop()
 
-    # Map accounts
-    tb_mapped = map_accounts(tb_df)
-    gl_mapped = map_accounts(gl_df)
+    # Map accounts and compute 3-statement data (reused when TB/GL are unchanged)
+    data_key = f"{_frame_fingerprint(tb_df)}:{_frame_fingerprint(gl_df)}"
+    financial_data = _build_financial_data(data_key, tb_df, gl_df)
 
-    # Compute 3-statement data
-    financial_data = calculate_3statements_from_tb_gl(tb_mapped, gl_mapped)
+    # Start the AI summary now: the Claude call is network-bound and independent of the
+    # Excel/preview work below, so running it in the background overlaps the two.
+    # Get API key from Streamlit secrets or environment
+    api_key = None
+    try:
+        api_key = st.secrets.get("ANTHROPIC_API_KEY")
+    except:
+        api_key = os.environ.get("ANTHROPIC_API_KEY")
+
+    # Determine data availability
+    has_balance_sheet = (tb_df is not None)
+    has_cash_flow = (tb_df is not None and len(financial_data) >= 2)
+
+    # Partial text is streamed through a queue; the worker thread must not call st.* itself.
+    summary_chunks = queue.Queue()
+    summary_executor = ThreadPoolExecutor(max_workers=1)
+    summary_future = summary_executor.submit(
+        generate_ai_summary,
+        financial_data=financial_data,
+        has_balance_sheet=has_balance_sheet,
+        has_cash_flow=has_cash_flow,
+        api_key=api_key,
+        on_text=summary_chunks.put,
+    )
+    summary_executor.shutdown(wait=False)
 
     # Write to template
     template_path = get_template_path(st.session_state["template_type"])
-    out_bytes = write_financial_data_to_template(
-        template_path=template_path,
-        financial_data=financial_data,
-        unit_scale=float(st.session_state["unit_scale"]),
+    excel_bytes = _build_excel_output(
+        template_path, data_key, financial_data, float(st.session_state["unit_scale"])
     )
 
-    # Persist output so Streamlit reruns don’t lose it
-    st.session_state["last_excel_bytes"] = out_bytes.getvalue()
+    # Persist output so Streamlit reruns don’t lose it (one bytes copy, shared with the download below)
+    st.session_state["last_excel_bytes"] = excel_bytes
 
     # Build a template-matching preview (Income Statement / Balance Sheet / Cash Flow)
     try:
@@ -634,7 +739,7 @@ if st.button("Generate 3-Statement Outputs", type="primary"):
     st.success("Generated Excel output.")
     st.download_button(
         "Download Excel Output",
-        data=out_bytes.getvalue(),
+        data=excel_bytes,
         file_name="3statement_output.xlsx",
         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     )
@@ -657,9 +762,7 @@ if st.button("Generate 3-Statement Outputs", type="primary"):
                     else:
                         # Clean display: Streamlit shows Python None as 'None' which is misleading for section headers.
                         # For website preview only: show blanks for headers and 0 for unmapped numeric rows (already 0 in df).
-                        df_show = df.copy()
-                        df_show = df_show.replace({None: np.nan})
-
+                        # _fmt_cell blanks None/NaN itself, so formatting is a single pass with no copy/replace first.
                         def _fmt_cell(x):
                             if pd.isna(x):
                                 return ""
@@ -667,40 +770,36 @@ if st.button("Generate 3-Statement Outputs", type="primary"):
                                 return f"{float(x):,.0f}"
                             return str(x)
 
-                        df_show = df_show.applymap(_fmt_cell)
+                        df_show = df.apply(lambda col: col.map(_fmt_cell))
                         st.dataframe(df_show, use_container_width=True)
 
     # ========================================
     # AI Summary Generation
     # ========================================
     try:
-        # Get API key from Streamlit secrets or environment
-        api_key = None
-        try:
-            api_key = st.secrets.get("ANTHROPIC_API_KEY")
-        except:
-            api_key = os.environ.get("ANTHROPIC_API_KEY")
-        
-        # Determine data availability
-        has_balance_sheet = (tb_df is not None)
-        has_cash_flow = (tb_df is not None and len(financial_data) >= 2)
-        
-        # Generate summary
-        summary_text, used_ai = generate_ai_summary(
-            financial_data=financial_data,
-            has_balance_sheet=has_balance_sheet,
-            has_cash_flow=has_cash_flow,
-            api_key=api_key
-        )
+        st.subheader("📊 AI Financial Summary")
+        status_placeholder = st.empty()
+        summary_placeholder = st.empty()
+
+        # Render the summary as it streams in, until the background call finishes
+        while not summary_future.done():
+            try:
+                partial = summary_chunks.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            while not summary_chunks.empty():
+                partial = summary_chunks.get_nowait()
+            summary_placeholder.markdown(partial)
+
+        summary_text, used_ai = summary_future.result()
         
         # Display summary
-        st.subheader("📊 AI Financial Summary")
         if used_ai:
-            st.success("✅ Generated using Claude AI")
+            status_placeholder.success("✅ Generated using Claude AI")
         else:
-            st.info("ℹ️ Generated using rule-based analysis (AI unavailable)")
+            status_placeholder.info("ℹ️ Generated using rule-based analysis (AI unavailable)")
         
-        st.markdown(summary_text)
+        summary_placeholder.markdown(summary_text)
         
     except Exception as e:
         st.warning(f"Could not generate AI summary: {str(e)}")
@@ -710,6 +809,10 @@ if st.button("Generate 3-Statement Outputs", type="primary"):
     # PDF Report Generation
     # ========================================
     try:
+        # ReportLab is only needed once outputs are generated; importing it here keeps
+        # it (~100 ms) off the app's cold start
+        from pdf_export import generate_pdf_report
+
         # Convert unit_scale to unit_label string
         unit_scale = st.session_state.get("unit_scale", 1000)
         if unit_scale == 1000:
@@ -17,9 +17,13 @@ from validation import (normalize_column_headers, check_required_columns,
                        validate_trial_balance, validate_gl_activity,
                        validate_common_issues, apply_auto_fixes)
 from mapping import (map_account_by_name, map_account_by_range, map_accounts,
+                    map_accounts_by_range,
                     normalize_account_name, classify_accrued_liability)
 from excel_writer import (find_row_by_label, is_formula_cell, 
                           calculate_financial_statements)
+import ai_summary
+from ai_summary import _cached_completion, clear_ai_cache, _RateLimiter
+from pdf_export import create_pdf_report, _report_styles, _summary_paragraphs
 
 
 class TestColumnNormalization:
@@ -180,6 +184,26 @@ class TestGLActivityValidation:
         info_issues = [i for i in issues if i['severity'] == 'Info']
         txnid_info = [i for i in info_issues if 'TransactionID' in i['issue']]
         assert len(txnid_info) > 0
+    
+    def test_parsing_issue_samples_show_raw_values(self):
+        """Sample rows show the offending input, not the coerced NaN/NaT"""
+        df = pd.DataFrame({
+            'TxnDate': ['2023-01-01', 'not a date'],
+            'AccountNumber': [1000, 4000],
+            'AccountName': ['Cash', 'Revenue'],
+            'Debit': ['abc', 0],
+            'Credit': [0, 100]
+        })
+
+        issues = validate_gl_activity(df)
+
+        parsing = [i for i in issues if i['category'] == 'Parsing']
+        assert len(parsing) == 1
+        assert parsing[0]['sample_data']['Debit'].tolist() == ['abc']
+
+        tb_issues = validate_trial_balance(df)
+        missing = [i for i in tb_issues if i['category'] == 'Missing Data']
+        assert missing[0]['sample_data']['TxnDate'].tolist() == ['not a date']
 
 
 class TestAccountMapping:
@@ -204,6 +228,15 @@ class TestAccountMapping:
         assert map_account_by_range(4000) == 'revenue'
         assert map_account_by_range(5000) == 'cogs'
     
+    def test_vectorized_range_matches_scalar(self):
+        """Test column-wise range mapping agrees with the per-account version"""
+        numbers = pd.Series([1000, 1099.5, 1599, 2500, 6999, 7000, -1, None])
+        expected = [map_account_by_range(x) for x in numbers]
+        assert map_accounts_by_range(numbers).tolist() == expected
+
+        overlapping = {'first': (1000, 1999), 'second': (1500, 2999)}
+        assert map_accounts_by_range(pd.Series([1500, 2500]), overlapping).tolist() == ['first', 'second']
+    
     def test_classify_accrued_payroll(self):
         """Test accrued liability classification"""
         assert classify_accrued_liability('Accrued Payroll') == 'accrued_payroll'
@@ -262,6 +295,22 @@ class TestCommonIssuesValidation:
         duplicates = [i for i in issues if 'duplicate' in i['issue'].lower()]
         assert len(duplicates) > 0
 
+    def test_future_date_beyond_nanosecond_range(self):
+        """Test that a year-3023 typo is reported as future-dated"""
+        df = pd.DataFrame({
+            'TxnDate': ['3023-01-01', '2023-01-01'],
+            'AccountNumber': [1000, 1000],
+            'AccountName': ['Cash', 'Cash'],
+            'Debit': [100, 100],
+            'Credit': [0, 0]
+        })
+
+        issues = validate_common_issues(df)
+
+        future = [i for i in issues if i['auto_fix'] == 'remove_future_dates']
+        assert len(future) == 1
+        assert future[0]['total_affected'] == 1
+
 
 class TestAutoFixes:
     """Test auto-fix functionality"""
@@ -296,6 +345,42 @@ class TestAutoFixes:
         assert not fixed['AccountNumber'].isna().any()
         assert fixed.loc[1, 'AccountNumber'] == 9999
 
+    def test_remove_future_dates_beyond_nanosecond_range(self):
+        """Test that a year-3023 typo is removed as a future date"""
+        df = pd.DataFrame({
+            'TxnDate': ['3023-01-01', '2023-01-01'],
+            'AccountNumber': [1000, 1000],
+            'AccountName': ['Cash', 'Cash'],
+            'Debit': [100, 100],
+            'Credit': [0, 0]
+        })
+
+        fixed, changes = apply_auto_fixes(df, ['remove_future_dates'])
+
+        assert len(fixed) == 1
+        assert len(changes) == 1
+    
+    def test_balance_transactions(self):
+        """Test suspense lines offset each unbalanced transaction"""
+        df = pd.DataFrame({
+            'TxnDate': ['2023-01-01'] * 6,
+            'TransactionID': ['T1', 'T1', 'T2', 'T2', 'T3', 'T3'],
+            'AccountNumber': [1000, 4000, 1000, 4000, 5000, 2000],
+            'AccountName': ['Cash', 'Revenue', 'Cash', 'Revenue', 'COGS', 'AP'],
+            'Debit': [100, 0, 50, 0, 30, 0],
+            'Credit': [0, 90, 0, 50, 0, 45]
+        })
+        
+        fixed, changes = apply_auto_fixes(df, ['balance_transactions'])
+        
+        added = fixed.iloc[len(df):]
+        assert added['TransactionID'].tolist() == ['T1', 'T3']
+        assert added['Debit'].tolist() == [0.0, 15.0]
+        assert added['Credit'].tolist() == [10.0, 0.0]
+        assert (added['AccountNumber'] == 9999).all()
+        totals = fixed.groupby('TransactionID')[['Debit', 'Credit']].sum()
+        assert (totals['Debit'] == totals['Credit']).all()
+
 
 class TestFinancialStatements:
     """Test financial statement calculation"""
@@ -321,6 +406,22 @@ class TestFinancialStatements:
         assert financial_data[2023]['marketing_admin'] == 100
         assert financial_data[2023]['tax_expense'] == 20
 
+    def test_year_beyond_nanosecond_range(self):
+        """Test that a date past 2262 is booked under its own year"""
+        df = pd.DataFrame({
+            'TxnDate': ['2023-12-31', '3023-01-01'],
+            'AccountNumber': [4000, 4000],
+            'AccountName': ['Revenue', 'Revenue'],
+            'Debit': [0, 0],
+            'Credit': [1000, 50],
+            'FSLI_Category': ['revenue', 'revenue']
+        })
+
+        financial_data = calculate_financial_statements(df, is_trial_balance=False)
+
+        assert sorted(financial_data) == [2023, 3023]
+        assert financial_data[3023]['revenue'] == 50
+
 
 class TestHeaderOrderIndependence:
     """Test that column order doesn't matter"""
@@ -385,6 +486,170 @@ class TestMultiYearHandling:
         assert 2025 in financial_data
 
 
+class _FakeMessages:
+    """Stand-in for client.messages that counts API calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        block = type('Block', (), {'text': f"response {self.calls}"})()
+        return type('Message', (), {'content': [block]})()
+
+    def stream(self, **kwargs):
+        self.calls += 1
+        messages = self
+
+        class _Stream:
+            text_stream = iter(["response ", str(messages.calls)])
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        return _Stream()
+
+
+class _FakeClient:
+    def __init__(self, api_key=None):
+        self.api_key = api_key
+        self.messages = _FakeMessages()
+
+
+class TestAIResponseCache:
+    """Test Claude response caching"""
+
+    def setup_method(self):
+        clear_ai_cache()
+
+    def test_identical_request_served_from_cache(self):
+        """Test that a repeated request does not call the API again"""
+        client = _FakeClient()
+        messages = [{'role': 'user', 'content': 'Analyze'}]
+
+        first = _cached_completion(client, 'claude-test', 100, messages)
+        second = _cached_completion(client, 'Claude-Test', 100, messages)
+
+        assert first == second
+        assert client.messages.calls == 1
+
+    def test_different_request_calls_api(self):
+        """Test that a changed prompt misses the cache"""
+        client = _FakeClient()
+
+        _cached_completion(client, 'claude-test', 100, [{'role': 'user', 'content': 'A'}])
+        _cached_completion(client, 'claude-test', 100, [{'role': 'user', 'content': 'B'}])
+
+        assert client.messages.calls == 2
+
+    def test_cache_scoped_to_api_key(self):
+        """Test that a response cached for one API key is not served to another"""
+        client_a = _FakeClient(api_key='key-a')
+        client_b = _FakeClient(api_key='key-b')
+        messages = [{'role': 'user', 'content': 'Analyze'}]
+
+        _cached_completion(client_a, 'claude-test', 100, messages)
+        _cached_completion(client_b, 'claude-test', 100, messages)
+
+        assert client_a.messages.calls == 1
+        assert client_b.messages.calls == 1
+
+    def test_streaming_reports_partial_text(self):
+        """Test that on_text receives the accumulated text, including on cache hits"""
+        client = _FakeClient()
+        messages = [{'role': 'user', 'content': 'Analyze'}]
+        seen = []
+
+        text = _cached_completion(client, 'claude-test', 100, messages, on_text=seen.append)
+        assert text == 'response 1'
+        assert seen == ['response ', 'response 1']
+
+        seen.clear()
+        _cached_completion(client, 'claude-test', 100, messages, on_text=seen.append)
+        assert seen == ['response 1']
+        assert client.messages.calls == 1
+
+
+class _FakeClock:
+    """Manual clock whose sleep() just advances time"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestAIRateLimiter:
+    """Test the client-side Claude rate limiter"""
+
+    def setup_method(self):
+        clear_ai_cache()
+
+    def test_request_limit_waits_for_window(self):
+        """Test that a call over the per-minute request budget waits for the window to roll"""
+        clock = _FakeClock()
+        limiter = _RateLimiter(rpm=2, tpm=1000, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire(10)
+        limiter.acquire(10)
+        assert clock.slept == []
+
+        limiter.acquire(10)
+        assert clock.slept == [60.0]
+
+    def test_429_is_retried_and_halves_budget(self, monkeypatch):
+        """Test that a 429 response backs off, retries and shrinks the request budget"""
+        clock = _FakeClock()
+        limiter = _RateLimiter(rpm=8, tpm=100000, clock=clock, sleep=clock.sleep)
+        monkeypatch.setattr(ai_summary, '_RATE_LIMITER', limiter)
+
+        class _RateLimitError(Exception):
+            status_code = 429
+
+        client = _FakeClient()
+        create = client.messages.create
+        failures = [_RateLimitError()]
+
+        def flaky_create(**kwargs):
+            if failures:
+                raise failures.pop()
+            return create(**kwargs)
+
+        client.messages.create = flaky_create
+
+        text = _cached_completion(client, 'claude-test', 100, [{'role': 'user', 'content': 'A'}])
+
+        assert text == 'response 1'
+        assert len(clock.slept) == 1
+        assert limiter.rpm == 5.0  # halved to 4, then +1 on success
+
+
+class TestPDFExport:
+    """Test PDF report generation"""
+
+    def test_summary_with_markup_characters(self):
+        """Test that '&', '<' and markdown headings in the AI summary render"""
+        financial_data = {
+            2022: {'revenue': 800, 'cogs': 300},
+            2023: {'revenue': 1000, 'cogs': 400},
+        }
+        summary = "## Key Trends\n\nMargin < 5% & falling <b>fast"
+
+        pdf = create_pdf_report(financial_data, ai_summary=summary)
+
+        assert pdf.getvalue().startswith(b'%PDF')
+        assert _summary_paragraphs("## Key Trends", _report_styles())[0].style.name == 'SummaryHeading'
+
+
 # Run tests if executed directly
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
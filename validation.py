@@ -36,6 +36,10 @@ def _coerce_numeric_series(s: pd.Series) -> pd.Series:
     if not isinstance(s, pd.Series):
         return pd.to_numeric(s, errors="coerce")
 
+    # Already numeric: nothing to clean, just return the nullable dtype the string path yields
+    if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+        return s.astype("Int64" if pd.api.types.is_integer_dtype(s) else "Float64")
+
     cleaned = s.copy()
 
     # Keep NaN as NaN, convert others to strings for cleaning
@@ -62,9 +66,9 @@ def normalize_column_headers(df: pd.DataFrame) -> pd.DataFrame:
 
     Standard columns:
       TxnDate, AccountNumber, AccountName, Debit, Credit, TransactionID, Currency
-    """
-    df = df.copy()
 
+    rename() already returns a new frame, so the caller's DataFrame is never modified.
+    """
     column_mappings = {
         "txndate": "TxnDate",
         "transaction_date": "TxnDate",
@@ -110,7 +114,7 @@ def _normalize_types(df: pd.DataFrame) -> pd.DataFrame:
     """Normalize headers + coerce TxnDate and numeric columns used across validators."""
     df = normalize_column_headers(df)
 
-    if "TxnDate" in df.columns:
+    if "TxnDate" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["TxnDate"]):
         df["TxnDate"] = pd.to_datetime(df["TxnDate"], errors="coerce")
 
     for col in ["Debit", "Credit", "AccountNumber", "Balance"]:
@@ -127,10 +131,54 @@ def check_required_columns(df: pd.DataFrame, data_type: str = "GL") -> Tuple[boo
     return (len(missing) == 0), missing
 
 
+def _row_issue_details(raw_df: pd.DataFrame, mask, count: int,
+                       max_rows: int = 100, max_samples: int = 25) -> Dict:
+    """
+    Issue fields for a row-level check, all derived from the one boolean mask.
+
+    raw_df is the caller's input frame, before _normalize_types (same rows, same
+    order), so sample_data shows the offending values as entered rather than NaT/<NA>.
+
+    Returns affected_rows (first `max_rows` index labels), total_affected and
+    sample_data (the first `max_samples` offending rows, for the UI).
+    """
+    if isinstance(mask, pd.Series):
+        mask = mask.to_numpy(dtype=bool, na_value=False)
+    positions = np.flatnonzero(mask)
+    return {
+        "affected_rows": raw_df.index[positions[:max_rows]].tolist(),
+        "total_affected": count,
+        "sample_data": raw_df.iloc[positions[:max_samples]],
+    }
+
+
 def _tolerance(max_amount: float, tolerance_abs: float, tolerance_rel: float) -> float:
     return float(max(tolerance_abs, max_amount * tolerance_rel))
 
 
+def _debit_credit_totals(df: pd.DataFrame) -> Tuple[float, float]:
+    """Overall Debit and Credit sums (NaN skipped), reduced straight off the NumPy buffers."""
+    debit = df["Debit"].to_numpy(dtype=float, na_value=np.nan)
+    credit = df["Credit"].to_numpy(dtype=float, na_value=np.nan)
+    return float(np.nansum(debit)), float(np.nansum(credit))
+
+
+def _unbalanced_groups(grouped: pd.DataFrame, tolerance_abs: float, tolerance_rel: float) -> pd.DataFrame:
+    """
+    Return the groups whose Debit/Credit sums differ by more than the tolerance.
+
+    `grouped` holds one row per period/transaction with summed Debit and Credit.
+    The tolerance is evaluated as one vectorized pass over the NumPy arrays
+    (same rule as _tolerance) and a Difference column is added to the result.
+    """
+    debit = grouped["Debit"].to_numpy(dtype=float)
+    credit = grouped["Credit"].to_numpy(dtype=float)
+    difference = debit - credit
+    tol = np.maximum(tolerance_abs, np.fmax(debit, credit) * tolerance_rel)
+    grouped = grouped.assign(Difference=difference)
+    return grouped.loc[np.abs(difference) > tol]
+
+
 # -----------------------------
 # TB validation
 # -----------------------------
@@ -154,6 +202,7 @@ def validate_trial_balance(
     if df is None or len(df) == 0:
         return issues
 
+    raw_df = df
     df = _normalize_types(df)
 
     # Check required columns
@@ -182,35 +231,29 @@ def validate_trial_balance(
             "impact": "TB balance checks may be unreliable for those rows",
             "suggestion": "Clean Debit/Credit formatting (remove $/commas/parentheses) or ensure valid numbers.",
             "auto_fix": "Attempted numeric coercion; remaining rows require upstream cleaning.",
-            "affected_rows": df.loc[bad_amt].index.tolist()[:100],
-            "total_affected": bad_amt_count,
+            **_row_issue_details(raw_df, bad_amt, bad_amt_count),
         })
 
     # Drop rows without valid TxnDate (can't group by period)
-    valid_date = df["TxnDate"].notna()
-    if not valid_date.all():
+    invalid_date = df["TxnDate"].isna()
+    invalid_date_count = int(invalid_date.sum())
+    if invalid_date_count > 0:
         # We'll warn, but still validate remaining
         issues.append({
             "severity": "Warning",
             "category": "Missing Data",
-            "issue": f"{int((~valid_date).sum())} row(s) have invalid/missing TxnDate",
+            "issue": f"{invalid_date_count} row(s) have invalid/missing TxnDate",
             "impact": "Those rows are excluded from per-period TB balance checks",
             "suggestion": "Fix TxnDate formatting or remove invalid rows.",
             "auto_fix": None,
-            "affected_rows": df.loc[~valid_date].index.tolist()[:100],
-            "total_affected": int((~valid_date).sum()),
+            **_row_issue_details(raw_df, invalid_date, invalid_date_count),
         })
 
-    df_chk = df.loc[valid_date].copy()
+    df_chk = df.loc[~invalid_date] if invalid_date_count > 0 else df
 
     # Per-period balance
     grouped = df_chk.groupby("TxnDate", dropna=True).agg({"Debit": "sum", "Credit": "sum"}).reset_index()
-    grouped["Difference"] = grouped["Debit"] - grouped["Credit"]
-    grouped["Abs_Diff"] = grouped["Difference"].abs()
-    grouped["Max_Amount"] = grouped[["Debit", "Credit"]].max(axis=1)
-    grouped["Tol"] = grouped["Max_Amount"].apply(lambda x: _tolerance(x, tolerance_abs, tolerance_rel))
-
-    unbalanced = grouped[grouped["Abs_Diff"] > grouped["Tol"]]
+    unbalanced = _unbalanced_groups(grouped, tolerance_abs, tolerance_rel)
     if len(unbalanced) > 0:
         issues.append({
             "severity": "Critical",
@@ -226,8 +269,7 @@ def validate_trial_balance(
         })
 
     # Overall balance
-    total_debit = float(df_chk["Debit"].sum(skipna=True))
-    total_credit = float(df_chk["Credit"].sum(skipna=True))
+    total_debit, total_credit = _debit_credit_totals(df_chk)
     diff = abs(total_debit - total_credit)
     tol = _tolerance(max(total_debit, total_credit), tolerance_abs, tolerance_rel)
 
@@ -269,6 +311,7 @@ def validate_gl_activity(
     if df is None or len(df) == 0:
         return issues
 
+    raw_df = df
     df = _normalize_types(df)
 
     # Check required columns
@@ -297,8 +340,7 @@ def validate_gl_activity(
             "impact": "GL balancing checks may be invalid",
             "suggestion": "Clean Debit/Credit formatting (remove $/commas/parentheses) or ensure valid numbers.",
             "auto_fix": "Attempted numeric coercion; remaining rows require upstream cleaning.",
-            "affected_rows": df.loc[bad_amt].index.tolist()[:100],
-            "total_affected": bad_amt_count,
+            **_row_issue_details(raw_df, bad_amt, bad_amt_count),
         })
 
     # Determine transaction-level capability
@@ -331,14 +373,9 @@ def validate_gl_activity(
 
     # Transaction-level balance check
     if has_txnid:
-        txn_df = df[df["TransactionID"].notna()].copy()
-        grouped = txn_df.groupby("TransactionID").agg({"Debit": "sum", "Credit": "sum"}).reset_index()
-        grouped["Difference"] = grouped["Debit"] - grouped["Credit"]
-        grouped["Abs_Diff"] = grouped["Difference"].abs()
-        grouped["Max_Amount"] = grouped[["Debit", "Credit"]].max(axis=1)
-        grouped["Tol"] = grouped["Max_Amount"].apply(lambda x: _tolerance(x, tolerance_abs, tolerance_rel))
-
-        unbalanced = grouped[grouped["Abs_Diff"] > grouped["Tol"]]
+        # groupby drops rows with a missing TransactionID, so no pre-filtered copy is needed
+        grouped = df.groupby("TransactionID").agg({"Debit": "sum", "Credit": "sum"}).reset_index()
+        unbalanced = _unbalanced_groups(grouped, tolerance_abs, tolerance_rel)
         if len(unbalanced) > 0:
             issues.append({
                 "severity": "Critical",
@@ -353,8 +390,7 @@ def validate_gl_activity(
             })
 
     # Overall balance check
-    total_debit = float(df["Debit"].sum(skipna=True))
-    total_credit = float(df["Credit"].sum(skipna=True))
+    total_debit, total_credit = _debit_credit_totals(df)
     diff = abs(total_debit - total_credit)
     tol = _tolerance(max(total_debit, total_credit), tolerance_abs, tolerance_rel)
 
@@ -393,86 +429,90 @@ def validate_common_issues(df: pd.DataFrame) -> List[Dict]:
     if df is None or len(df) == 0:
         return issues
 
+    raw_df = df
     df = _normalize_types(df)
 
+    # Pull each checked column out as a plain NumPy array once; every mask below
+    # is a ufunc over these rather than a fresh pandas pass over the frame
+    # (TxnDate stays in its native unit: forcing datetime64[ns] wraps dates past 2262)
+    txn = df["TxnDate"].to_numpy() if "TxnDate" in df.columns else None
+    acct = (df["AccountNumber"].to_numpy(dtype=float, na_value=np.nan)
+            if "AccountNumber" in df.columns else None)
+
     # Missing dates
-    if "TxnDate" in df.columns:
-        missing_dates = df["TxnDate"].isna()
-        if int(missing_dates.sum()) > 0:
-            rows = df[missing_dates].index.tolist()
+    if txn is not None:
+        missing_dates = np.isnat(txn)
+        missing_dates_count = int(missing_dates.sum())
+        if missing_dates_count:
             issues.append({
                 "severity": "Warning",
                 "category": "Missing Data",
-                "issue": f"{int(missing_dates.sum())} row(s) missing/invalid TxnDate",
+                "issue": f"{missing_dates_count} row(s) missing/invalid TxnDate",
                 "impact": "Cannot determine period for those rows",
                 "suggestion": "Fix TxnDate formatting or remove rows",
                 "auto_fix": "remove_missing_dates",
-                "affected_rows": rows[:100],
-                "total_affected": len(rows),
+                **_row_issue_details(raw_df, missing_dates, missing_dates_count),
             })
 
     # Missing / invalid account numbers
-    if "AccountNumber" in df.columns:
-        missing_acct = df["AccountNumber"].isna()
-        if int(missing_acct.sum()) > 0:
-            rows = df[missing_acct].index.tolist()
+    if acct is not None:
+        missing_acct = np.isnan(acct)
+        missing_acct_count = int(missing_acct.sum())
+        if missing_acct_count:
             issues.append({
                 "severity": "Critical",
                 "category": "Missing Data",
-                "issue": f"{int(missing_acct.sum())} row(s) without AccountNumber",
+                "issue": f"{missing_acct_count} row(s) without AccountNumber",
                 "impact": "Cannot map categories for those rows",
                 "suggestion": "Provide AccountNumber or map to 9999 (Unclassified)",
                 "auto_fix": "map_unclassified",
-                "affected_rows": rows[:100],
-                "total_affected": len(rows),
+                **_row_issue_details(raw_df, missing_acct, missing_acct_count),
             })
 
-        valid_accts = df["AccountNumber"].notna()
-        invalid_acct = (df.loc[valid_accts, "AccountNumber"] < 0) | (df.loc[valid_accts, "AccountNumber"] > 99999)
-        if int(invalid_acct.sum()) > 0:
-            rows = df.loc[valid_accts].loc[invalid_acct].index.tolist()
+        # NaN compares False, so missing numbers never count as invalid
+        invalid_acct = (acct < 0) | (acct > 99999)
+        invalid_acct_count = int(invalid_acct.sum())
+        if invalid_acct_count:
             issues.append({
                 "severity": "Critical",
                 "category": "Data Quality",
-                "issue": f"{int(invalid_acct.sum())} invalid AccountNumber value(s)",
+                "issue": f"{invalid_acct_count} invalid AccountNumber value(s)",
                 "impact": "Mapping errors likely",
                 "suggestion": "Fix account numbers (no negatives; within expected range)",
                 "auto_fix": "fix_account_numbers",
-                "affected_rows": rows[:100],
-                "total_affected": len(rows),
+                **_row_issue_details(raw_df, invalid_acct, invalid_acct_count),
             })
 
     # Duplicates (TransactionID)
     if "TransactionID" in df.columns:
         duplicates = df.duplicated(subset=["TransactionID"], keep=False)
-        if int(duplicates.sum()) > 0:
-            rows = df[duplicates].index.tolist()
+        duplicates_count = int(duplicates.sum())
+        if duplicates_count:
             issues.append({
                 "severity": "Warning",
                 "category": "Duplicates",
-                "issue": f"{int(duplicates.sum())} duplicated TransactionID row(s)",
+                "issue": f"{duplicates_count} duplicated TransactionID row(s)",
                 "impact": "May double-count transactions",
                 "suggestion": "Remove duplicate rows or fix TransactionID export",
                 "auto_fix": "remove_duplicates",
-                "affected_rows": rows[:100],
-                "total_affected": len(rows),
+                **_row_issue_details(raw_df, duplicates, duplicates_count),
             })
 
     # Future dates
-    if "TxnDate" in df.columns:
-        now = pd.Timestamp.now()
-        future_dates = df["TxnDate"] > now
-        if int(future_dates.sum()) > 0:
-            rows = df[future_dates].index.tolist()
+    if txn is not None:
+        # NaT compares False, so missing dates never count as future. 'now' is cast to the
+        # column's unit; otherwise NumPy would promote the column to ns and overflow.
+        future_dates = txn > pd.Timestamp.now().to_datetime64().astype(txn.dtype)
+        future_dates_count = int(future_dates.sum())
+        if future_dates_count:
             issues.append({
                 "severity": "Warning",
                 "category": "Data Quality",
-                "issue": f"{int(future_dates.sum())} future-dated row(s)",
+                "issue": f"{future_dates_count} future-dated row(s)",
                 "impact": "May skew current period",
                 "suggestion": "Correct dates or remove rows",
                 "auto_fix": "remove_future_dates",
-                "affected_rows": rows[:100],
-                "total_affected": len(rows),
+                **_row_issue_details(raw_df, future_dates, future_dates_count),
             })
 
     return issues
@@ -483,7 +523,7 @@ def apply_auto_fixes(df: pd.DataFrame, selected_fixes: List[str]) -> Tuple[pd.Da
     Apply selected auto-fixes to TB/GL data safely.
     Returns: (df_fixed, changes_log)
     """
-    df = df.copy()
+    # _normalize_types works on its own renamed frame, so no up-front copy is needed
     df = _normalize_types(df)
 
     changes: List[str] = []
@@ -499,8 +539,10 @@ def apply_auto_fixes(df: pd.DataFrame, selected_fixes: List[str]) -> Tuple[pd.Da
     # remove_future_dates
     if "remove_future_dates" in selected_fixes and "TxnDate" in df.columns:
         before = len(df)
-        now = pd.Timestamp.now()
-        df = df[df["TxnDate"] <= now]
+        # Compare in the column's own datetime64 unit (forcing ns would wrap dates past
+        # 2262); NaT compares False and is dropped, as before
+        txn = df["TxnDate"].to_numpy()
+        df = df[txn <= pd.Timestamp.now().to_datetime64().astype(txn.dtype)]
         removed = before - len(df)
         if removed > 0:
             changes.append(f"Removed {removed} rows with future TxnDate")
@@ -533,30 +575,27 @@ def apply_auto_fixes(df: pd.DataFrame, selected_fixes: List[str]) -> Tuple[pd.Da
 
     # balance_transactions (add a balancing line to Suspense per unbalanced TransactionID)
     if "balance_transactions" in selected_fixes and "TransactionID" in df.columns:
-        txn_df = df[df["TransactionID"].notna()].copy()
+        txn_df = df[df["TransactionID"].notna()]
         if len(txn_df) > 0:
             grp = txn_df.groupby("TransactionID").agg({"Debit":"sum","Credit":"sum"}).reset_index()
-            grp["Diff"] = grp["Debit"] - grp["Credit"]
-            unb = grp[grp["Diff"].abs() > 0.01]
+            diff = grp["Debit"].to_numpy(dtype=float, na_value=0.0) - grp["Credit"].to_numpy(dtype=float, na_value=0.0)
+            grp["Diff"] = diff
+            # Opposite side that nets each transaction to zero: the positive part of
+            # Diff goes to Credit, the negative part to Debit (one subtraction, two clips)
+            grp["OffsetDebit"] = np.maximum(-diff, 0.0)
+            grp["OffsetCredit"] = np.maximum(diff, 0.0)
+            unb = grp[np.abs(diff) > 0.01]
             if len(unb) > 0:
-                rows_to_add = []
-                for _, r in unb.iterrows():
-                    tid = r["TransactionID"]
-                    diff = float(r["Diff"])
-                    sample = txn_df[txn_df["TransactionID"]==tid].head(1)
-                    base_row = sample.iloc[0].to_dict() if len(sample)>0 else {}
-                    base_row["AccountNumber"] = 9999
-                    base_row["AccountName"] = "Suspense - Auto Balance"
-                    # add opposite side to make the transaction net to zero
-                    if diff > 0:
-                        base_row["Debit"] = 0.0
-                        base_row["Credit"] = diff
-                    else:
-                        base_row["Debit"] = -diff
-                        base_row["Credit"] = 0.0
-                    base_row["Description"] = f"Auto-balance transaction {tid} to suspense"
-                    rows_to_add.append(base_row)
-                df = pd.concat([df, pd.DataFrame(rows_to_add)], ignore_index=True)
+                # The first line of each unbalanced transaction is the template for its suspense line
+                first_lines = txn_df.drop_duplicates(subset="TransactionID", keep="first")
+                added = first_lines.set_index("TransactionID", drop=False).loc[unb["TransactionID"].to_numpy()]
+                added = added.reset_index(drop=True)
+                added["AccountNumber"] = 9999
+                added["AccountName"] = "Suspense - Auto Balance"
+                added["Debit"] = unb["OffsetDebit"].to_numpy()
+                added["Credit"] = unb["OffsetCredit"].to_numpy()
+                added["Description"] = [f"Auto-balance transaction {tid} to suspense" for tid in unb["TransactionID"]]
+                df = pd.concat([df, added], ignore_index=True)
                 changes.append(f"Added {len(unb)} suspense line(s) to auto-balance unbalanced transactions")
 
     # balance_gl_overall (add one balancing line to Suspense to make total debits == credits)
@@ -655,7 +694,7 @@ def validate_year0_opening_snapshot(tb_df: pd.DataFrame, statement_years: int =
     if "TxnDate" not in df.columns:
         return ["TB: missing TxnDate column (cannot validate Year0 opening snapshot)"]
 
-    df = df[df["TxnDate"].notna()].copy()
+    df = df[df["TxnDate"].notna()]
     if df.empty:
         return ["TB: TxnDate column has no valid dates (cannot validate Year0 opening snapshot)"]
 